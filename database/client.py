@@ -4,7 +4,8 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 import random
-from bson import ObjectId
+from bson import Binary, ObjectId
+from datetime import datetime, timezone
 
 
 class YouTubeDB:
@@ -13,6 +14,7 @@ class YouTubeDB:
         self.db = self.client[db_name]
         self.secret_collection = self.db["client_secrets"]
         self.channel_collection = self.db["channels"]
+        self.maze_collection = self.db["mazes"]
         self.SCOPES = [
             "https://www.googleapis.com/auth/youtube",
             "https://www.googleapis.com/auth/youtube.upload",
@@ -224,6 +226,24 @@ class YouTubeDB:
             solution_position,
         )
 
+    def record_mazes(self, channel_id, mazes):
+        """Store the bit-packed layouts of the mazes used in a video for auditing"""
+        if not mazes:
+            return
+        created_at = datetime.now(timezone.utc)
+        self.maze_collection.insert_many(
+            [
+                {
+                    "channel_id": channel_id,
+                    "level": maze["level"],
+                    "seed": maze["seed"],
+                    "walls": Binary(maze["walls"]),
+                    "created_at": created_at,
+                }
+                for maze in mazes
+            ]
+        )
+
     def get_all_channels(self, test=False):
         """Return all channels in the database"""
         return list(self.channel_collection.find({"test": test}, {"_id": 0, "channel_id": 1}))
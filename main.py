@@ -2,16 +2,33 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import multiprocessing
 from tqdm import tqdm
 from video_uploader.uploader import YouTubeUploader
-from maze_generator import Maze
+from maze_generator import (
+    LARGE_LEVEL_SIZES,
+    LEVEL_SIZES,
+    Maze,
+    MazeRenderer,
+    SolutionReveal,
+    Viewport,
+)
+from maze_generator.bank import MazeBank
+from maze_generator.dedup import DedupIndex
+from maze_generator.render import SOLUTION_RATIO, WALL_RATIO
+from maze_generator.viewport import pan_unit_size
 import os
-from video_editor.editor import VideoEditor
+from video_editor.editor import VideoEditor, image_size
 from content_ai.generator import generate
 import random
 from content_ai.generator import VideoContent
 import json
+import secrets
+import threading
 from collections import Counter
 
 done_file = "done.txt"
+maze_banks = {}
+maze_banks_lock = threading.Lock()
+dedup_index = None
+MAX_DEDUP_ATTEMPTS = 10
 
 def mark_done(channel_id: str, lock):
     with lock:
@@ -26,41 +43,122 @@ def load_done_counts():
     return Counter()
 
 
-def get_maze(level: str, color_scheme=None):
-    match level:
-        case "B":
-            MAZE_HEIGHT = MAZE_WIDTH = 12
-        case "M":
-            MAZE_HEIGHT = MAZE_WIDTH = 20
-        case "H":
-            MAZE_HEIGHT = MAZE_WIDTH = 30
-        case _:
-            raise Exception(f"Unknown maze level: {level}")
-    UNIT_SIZE = 500 // MAZE_WIDTH
-    WALL_THICKNESS = 300 // MAZE_WIDTH
-    SOLUTION_WIDTH = 200 // MAZE_WIDTH
-    SOLUTION_WIDTH = min(SOLUTION_WIDTH, UNIT_SIZE)  # Ensure solution fits
-    maze_obj = Maze(MAZE_HEIGHT, MAZE_WIDTH, color_scheme)
+def get_bank(level: str):
+    """Returns the shared maze bank for a level, or None if MAZE_BANK_DIR is not set."""
+    bank_dir = os.getenv("MAZE_BANK_DIR")
+    if not bank_dir:
+        return None
+    with maze_banks_lock:
+        if level not in maze_banks:
+            maze_banks[level] = MazeBank(bank_dir, level)
+        return maze_banks[level]
+
+
+def get_dedup():
+    """Returns the shared de-duplication index, or None if MAZE_DEDUP_PATH is not set."""
+    global dedup_index
+    path = os.getenv("MAZE_DEDUP_PATH")
+    if not path:
+        return None
+    with maze_banks_lock:
+        if dedup_index is None:
+            dedup_index = DedupIndex(path)
+        return dedup_index
+
+
+def get_maze(
+    level: str, color_scheme=None, seed=None, endpoints="corners", reveal_solution=False
+):
+    if level not in LEVEL_SIZES:
+        raise Exception(f"Unknown maze level: {level}")
+    MAZE_HEIGHT = MAZE_WIDTH = LEVEL_SIZES[level]
+    # Prefer a pre-generated maze; ``seed`` only applies when the bank is empty.
+    # Banked mazes have corner endpoints, so other endpoints are generated here.
+    bank = get_bank(level) if endpoints == "corners" else None
+    dedup = get_dedup()
+    for _ in range(MAX_DEDUP_ATTEMPTS):
+        maze_obj = bank.take() if bank else None
+        if maze_obj is None:
+            maze_obj = Maze(MAZE_HEIGHT, MAZE_WIDTH, seed=seed)
+            maze_obj.generate(endpoints=endpoints)
+            maze_obj.solve()
+        # Skip mazes already published on any channel, up to any rotation or
+        # mirror. The maze is recorded by main() once its video is uploaded.
+        if dedup is None or maze_obj.grid not in dedup:
+            break
+        print(f"Maze {maze_obj.seed} was already used, regenerating.")
+        seed = None if seed is None else random.Random(seed).getrandbits(63)
+    else:
+        raise Exception(
+            f"No unpublished {level} maze after {MAX_DEDUP_ATTEMPTS} attempts;"
+            " the de-duplication index may be over capacity."
+        )
+
+    # Label images at the frame size, painted by the editor straight into its
+    # frame buffers. The walls are drawn once; the solved clip paints the
+    # solution labels over them, or traces them with the reveal.
+    renderer = MazeRenderer(color_scheme)
+    reveal = None
+    if reveal_solution:
+        reveal = SolutionReveal(maze_obj.to_grid(), renderer, image_size)
+        walls, solution = reveal.walls, reveal.solution
+    else:
+        walls, solution = renderer.layer_labels(maze_obj.to_grid(), image_size)
+
+    def draw_maze(out):
+        renderer.paint(walls, out)
+
+    def draw_solution(out):
+        renderer.paint(walls, out)
+        renderer.paint(solution, out, transparent_background=True)
+
+    return draw_maze, draw_solution, reveal, maze_obj
+
+
+def get_large_maze(level: str, color_scheme=None, seed=None, solution_duration=2):
+    """
+    Generates an XL/XXL maze, which is shown through a viewport instead of whole.
+
+    Returns:
+        tuple: ``(maze_img, viewport, maze_obj)``: the view around the entrance,
+               the Viewport for the camera-follow solution clip, and the maze.
+               The solution viewport is zoomed out as far as needed to pan
+               along the path in ``solution_duration`` at a watchable speed.
+    """
+    if level not in LARGE_LEVEL_SIZES:
+        raise Exception(f"Unknown maze level: {level}")
+    MAZE_HEIGHT = MAZE_WIDTH = LARGE_LEVEL_SIZES[level]
+    # Corridors as wide as on an M maze in the 1080px frame for XL, half that for XXL
+    UNIT_SIZE = 24 if level == "XL" else 12
+    WALL_THICKNESS = round(UNIT_SIZE * WALL_RATIO)
+    SOLUTION_WIDTH = round(UNIT_SIZE * SOLUTION_RATIO)
+    maze_obj = Maze(MAZE_HEIGHT, MAZE_WIDTH, seed=seed)
     maze_obj.generate()
     maze_obj.solve()
 
-    maze_img = maze_obj.save_image(
-        None,
-        unit_size=UNIT_SIZE,
-        wall_thickness=WALL_THICKNESS,
-        show_solution=False,
-        solution_width=SOLUTION_WIDTH,  # Pass solution width even if not shown, for consistency
-    )
-
-    solution_img = maze_obj.save_image(
-        None,
+    maze_grid = maze_obj.to_grid()
+    renderer = MazeRenderer(color_scheme)
+    viewport = Viewport(
+        maze_grid,
+        renderer,
+        size=image_size,
         unit_size=UNIT_SIZE,
         wall_thickness=WALL_THICKNESS,
-        show_solution=True,
-        solution_width=SOLUTION_WIDTH,  # Pass solution width even if not shown, for consistency
+        solution_width=SOLUTION_WIDTH,
     )
-
-    return maze_img, solution_img
+    maze_img = viewport.render(viewport.camera(0), progress=0)
+
+    pan_unit = pan_unit_size(maze_grid, solution_duration, UNIT_SIZE)
+    if pan_unit != UNIT_SIZE:
+        viewport = Viewport(
+            maze_grid,
+            renderer,
+            size=image_size,
+            unit_size=pan_unit,
+            wall_thickness=max(1, round(pan_unit * WALL_RATIO)),
+            solution_width=max(1, round(pan_unit * SOLUTION_RATIO)),
+        )
+    return maze_img, viewport, maze_obj
 
 
 def get_duration(
@@ -82,6 +180,8 @@ def get_duration(
             "Total duration must be greater than solution duration times total levels"
         )
     # divide the remaining time in ratio of 1:2:3 for easy, medium, and hard levels
+    if level in LARGE_LEVEL_SIZES:
+        level = "H"  # Large levels are timed like hard ones
     if level not in ["B", "M", "H"]:
         raise ValueError("Level must be one of 'B', 'M', or 'H'")
 
@@ -97,7 +197,7 @@ def get_duration(
     return None
 
 
-def get_ctas(level: str, total_levels: int = 3):
+def get_ctas(level: str, total_levels: int = 3, rng=random):
     easy_ctas = [
         "Warm-up time! Can you solve this one fast?",
         "Start strong! Get this easy one right.",
@@ -139,13 +239,15 @@ def get_ctas(level: str, total_levels: int = 3):
             "Which was hardest? 1st, 2nd, or 3rd?",
             "Which maze got you? Drop the level in comments!",
         ]
+    if level in LARGE_LEVEL_SIZES:
+        level = "H"
     match level:
         case "B":
-            return random.choice(easy_ctas)
+            return rng.choice(easy_ctas)
         case "M":
-            return random.choice(medium_ctas)
+            return rng.choice(medium_ctas)
         case "H":
-            return random.choice(hard_ctas)
+            return rng.choice(hard_ctas)
         case _:
             raise Exception(f"Unknown maze level: {level}")
 
@@ -157,6 +259,8 @@ def get_timer_text(
     high_only: bool = False,
     current_level: int = 1,
 ):
+    if level in LARGE_LEVEL_SIZES:
+        level = "H"
     maze_timer_text = ""
     solution_timer_text = ""
     if solution_position == 0 and total_levels > 1:
@@ -198,14 +302,20 @@ def main(
     color_scheme=None,
     font_scheme=None,
     upload=True,
+    seed=None,
+    reveal_solution=False,
+    video_backend="moviepy",
 ):
+    # Every random choice in a job comes from the job seed, so a run can be replayed
+    seed = seed if seed is not None else secrets.randbits(63)
+    rng = random.Random(seed)
     levels = levels or ["B", "M", "H"]  # Default levels if not provided
     total_duration = total_duration or 60  # Default total duration in seconds
     solution_duration = solution_duration
     solution_position = (
         solution_position if solution_position in [-1, 0, 1] else 0
     )  # Default to mid if invalid
-    cta2 = get_ctas("H", len(levels))
+    cta2 = get_ctas("H", len(levels), rng)
 
     high_only = False
     if list(set(levels)) == ["H"]:
@@ -213,12 +323,14 @@ def main(
 
     clips = []
     solution_clips = []
+    mazes = []
+    dedup_grids = []  # Recorded as published once the upload succeeded
     for idx, level in enumerate(levels):
         timer = idx < len(levels) - 1 and solution_position == 0
         maze_timer_text, solution_timer_text = get_timer_text(
             level, solution_position, len(levels), high_only, idx + 1
         )
-        cta = get_ctas(level, len(levels))
+        cta = get_ctas(level, len(levels), rng)
         if len(levels) == 1:
             label_text = "Solve this maze!"
             solution_label_text = "Solution"
@@ -226,12 +338,36 @@ def main(
             label_text = f"Level {idx + 1} of {len(levels)}"
             solution_label_text = f"Solution of level {idx + 1}"
 
-        maze_img, solution_img = get_maze(level, color_scheme=color_scheme["maze"])
-        maze_img = maze_img.resize((1080, 1080))
-        solution_img = solution_img.resize((1080, 1080))
+        solution_frames = None
+        if level in LARGE_LEVEL_SIZES:
+            # The solution clip pans a camera along the path instead of a still image
+            maze_img, viewport, maze_obj = get_large_maze(
+                level,
+                color_scheme=color_scheme["maze"],
+                seed=rng.getrandbits(63),
+                solution_duration=solution_duration,
+            )
+            draw_maze = draw_solution = None
+            solution_frames = viewport.frame_function(solution_duration)
+        else:
+            maze_img = None
+            draw_maze, draw_solution, reveal, maze_obj = get_maze(
+                level,
+                color_scheme=color_scheme["maze"],
+                seed=rng.getrandbits(63),
+                reveal_solution=reveal_solution,
+            )
+            dedup_grids.append(maze_obj.grid)
+            if reveal_solution:
+                # The solution clip traces the path instead of showing it at once
+                solution_frames = reveal.frame_function(solution_duration)
+        mazes.append(
+            {"level": level, "seed": maze_obj.seed, "walls": maze_obj.to_bytes()}
+        )
         clips.append(
             {
                 "image": maze_img,
+                "draw": draw_maze,
                 "label": label_text,
                 "duration": get_duration(
                     level, total_duration, solution_duration, len(levels), high_only
@@ -244,7 +380,9 @@ def main(
         if solution_position == 0:
             clips.append(
                 {
-                    "image": solution_img,
+                    "image": maze_img,
+                    "draw": draw_solution,
+                    "frames": solution_frames,
                     "label": solution_label_text,
                     "duration": solution_duration,
                     "timer": timer,
@@ -255,7 +393,9 @@ def main(
         if solution_position == 1:
             solution_clips.append(
                 {
-                    "image": solution_img,
+                    "image": maze_img,
+                    "draw": draw_solution,
+                    "frames": solution_frames,
                     "label": solution_label_text,
                     "duration": solution_duration,
                     "timer": False,
@@ -266,10 +406,14 @@ def main(
     clips += solution_clips
     os.makedirs("output", exist_ok=True)
 
-    random_path = os.path.join("output", f"maze_{random.randint(10000, 99999)}.mp4")
+    random_path = os.path.join("output", f"maze_{seed}.mp4")
 
     video_editor = VideoEditor(
-        clips, random_path, color_scheme=color_scheme["video"], font_scheme=font_scheme
+        clips,
+        random_path,
+        color_scheme=color_scheme["video"],
+        font_scheme=font_scheme,
+        backend=video_backend,
     )
     video_editor.create_video(preview=False)
 
@@ -290,7 +434,7 @@ def main(
         # Upload the video to YouTube
         uploader = YouTubeUploader(creds)
         response = uploader.upload_video(
-            random_path.replace(".mp4", "_60fps.mp4"),
+            random_path,
             title=meta.title,
             description=meta.description,
             category_id=20,
@@ -308,8 +452,13 @@ def main(
             ],
         )
         print(f"Video uploaded successfully: https://youtube.com/shorts/{response['id']}")
+        dedup = get_dedup()
+        if dedup is not None:
+            for grid in dedup_grids:
+                dedup.add(grid)
+            dedup.flush()
     os.remove(random_path)
-    os.remove(random_path.replace(".mp4", "_60fps.mp4"))
+    return {"seed": seed, "mazes": mazes}
 
 
 if __name__ == "__main__":
@@ -329,6 +478,10 @@ if __name__ == "__main__":
 
     upload = os.environ.get("UPLOAD", "true").lower() == "true"
 
+    reveal_solution = os.environ.get("REVEAL_SOLUTION", "false").lower() == "true"
+
+    video_backend = os.environ.get("VIDEO_BACKEND", "moviepy").lower()
+
     multiplier = os.getenv("MULTIPLIER")
 
     workers = os.getenv("WORKERS")
@@ -394,7 +547,7 @@ if __name__ == "__main__":
             f"Creating video for channel {channel_id} with levels {levels}, total duration {total_duration}, solution duration {solution_duration}, solution position {solution_position}"
         )
         try:
-            main(
+            job = main(
                 levels=levels,
                 total_duration=total_duration,
                 solution_duration=solution_duration,
@@ -403,10 +556,20 @@ if __name__ == "__main__":
                 color_scheme=color_scheme,
                 font_scheme=font_scheme,
                 upload=upload,
+                reveal_solution=reveal_solution,
+                video_backend=video_backend,
             )
-            mark_done(channel_id, lock)
         except Exception as e:
             print(f"❌ Error creating video for channel {channel_id}: {e}")
+            return
+        seeds = [maze["seed"] for maze in job["mazes"]]
+        print(f"Job seed for channel {channel_id}: {job['seed']}, maze seeds: {seeds}")
+        # The video is out, so a failed DB write must not make the job run again
+        try:
+            db.record_mazes(channel_id, job["mazes"])
+        except Exception as e:
+            print(f"❌ Error recording mazes for channel {channel_id}: {e}")
+        mark_done(channel_id, lock)
         print(f"✅ Video created successfully for channel {channel_id}")
 
     manager = multiprocessing.Manager()
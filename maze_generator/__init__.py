@@ -1,3 +1,25 @@
-from .maze import Maze
+from .maze import LARGE_LEVEL_SIZES, LEVEL_SIZES, Maze
+from .grid import MazeGrid
+from .render import MazeRenderer
+from .viewport import Viewport
+from .reveal import SolutionReveal
+from .streaming import eller_rows
+from .analytics import analyze, difficulty_score, generate_for_difficulty
+from .graph import TOPOLOGIES, GraphMaze, MazeGraph
 
-__all__ = ["Maze"]
+__all__ = [
+    "LARGE_LEVEL_SIZES",
+    "LEVEL_SIZES",
+    "TOPOLOGIES",
+    "GraphMaze",
+    "Maze",
+    "MazeGraph",
+    "MazeGrid",
+    "MazeRenderer",
+    "SolutionReveal",
+    "Viewport",
+    "analyze",
+    "difficulty_score",
+    "eller_rows",
+    "generate_for_difficulty",
+]
@@ -0,0 +1,287 @@
+"""
+Flat-index maze generation algorithms.
+
+Every algorithm works on integer cell indices (``index = row * width + col``)
+and a precomputed neighbor table instead of ``(r, c)`` tuples and bounds
+checks. Each one returns a spanning tree as a parent array: ``parent[i]`` is
+the cell that ``i`` was connected to, or ``NO_PARENT`` for the root. The
+``Maze`` class turns that tree into its ``grid`` layout.
+
+All algorithms take an optional ``cells`` list, the cells to span when only
+part of the lattice is in use (shape masks). The neighbor table must then
+already leave out the other cells, so the hot loops never check a mask.
+"""
+
+import heapq
+import secrets
+from functools import lru_cache
+
+import numpy as np
+
+NO_PARENT = -1
+
+# Direction order matches the original (N, S, W, E) offsets used by Maze.
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def seeded_rng(seed=None):
+    """
+    Resolves a maze seed and creates the maze's own RNG from it.
+
+    Args:
+        seed (int | np.random.Generator | None): A Generator is used to draw
+            the seed, and None picks a fresh one.
+
+    Returns:
+        tuple: ``(seed, rng)``, the int seed to record and its Generator.
+    """
+    if isinstance(seed, np.random.Generator):
+        seed = int(seed.integers(2**63))
+    elif seed is None:
+        seed = secrets.randbits(63)
+    return int(seed), np.random.default_rng(int(seed))
+
+
+@lru_cache(maxsize=32)
+def neighbor_table(height, width):
+    """
+    Builds the neighbor table of a rectangular lattice.
+
+    Args:
+        height (int): Number of cell rows.
+        width (int): Number of cell columns.
+
+    Returns:
+        np.ndarray: Read-only ``(height * width, 4)`` int32 array holding the
+                    N, S, W and E neighbor of every cell, or ``NO_PARENT``
+                    where the neighbor would fall outside the lattice.
+    """
+    rows, cols = np.divmod(np.arange(height * width, dtype=np.int32), width)
+    table = np.full((height * width, len(DIRECTIONS)), NO_PARENT, dtype=np.int32)
+    for k, (dr, dc) in enumerate(DIRECTIONS):
+        nr, nc = rows + dr, cols + dc
+        inside = (nr >= 0) & (nr < height) & (nc >= 0) & (nc < width)
+        table[inside, k] = nr[inside] * width + nc[inside]
+    table.setflags(write=False)
+    return table
+
+
+def _uniforms(rng, block=4096):
+    """Yields uniform floats in [0, 1), drawn from ``rng`` in blocks."""
+    while True:
+        yield from rng.random(block).tolist()
+
+
+def _adjacency(neighbors):
+    """Converts a padded neighbor table into per-cell lists of valid neighbors."""
+    return [[n for n in row if n != NO_PARENT] for row in neighbors.tolist()]
+
+
+def _shuffled_rows(neighbors, rng):
+    """Returns the neighbor table with every row in an independent random order."""
+    order = np.argsort(rng.random(neighbors.shape), axis=1)
+    return np.take_along_axis(neighbors, order, axis=1).tolist()
+
+
+def _start(cells, n, rng):
+    """Picks a random cell to start from, among ``cells`` if given."""
+    if cells is None:
+        return int(rng.integers(n))
+    return int(cells[rng.integers(len(cells))])
+
+
+def _orient(n, a, b, root):
+    """Turns an undirected spanning tree given as edge lists into a parent array."""
+    adjacency = [[] for _ in range(n)]
+    for u, v in zip(a, b):
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+    parent = [NO_PARENT] * n
+    seen = [False] * n
+    seen[root] = True
+    stack = [root]
+    while stack:
+        cell = stack.pop()
+        for nxt in adjacency[cell]:
+            if not seen[nxt]:
+                seen[nxt] = True
+                parent[nxt] = cell
+                stack.append(nxt)
+    return parent
+
+
+def backtracker(neighbors, rng, cells=None):
+    """
+    Recursive backtracker (randomized depth-first search).
+
+    Each cell's neighbors are visited in a random order drawn once up front,
+    which picks uniformly among the unvisited neighbors exactly like choosing
+    at random on every step, without building a candidate list per step.
+    """
+    n = len(neighbors)
+    rows = _shuffled_rows(neighbors, rng)
+    parent = [NO_PARENT] * n
+    visited = [False] * n
+    cursor = [0] * n
+
+    start = _start(cells, n, rng)
+    visited[start] = True
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        row = rows[cell]
+        k = cursor[cell]
+        while k < len(row):
+            nxt = row[k]
+            k += 1
+            if nxt != NO_PARENT and not visited[nxt]:
+                cursor[cell] = k
+                visited[nxt] = True
+                parent[nxt] = cell
+                stack.append(nxt)
+                break
+        else:
+            stack.pop()
+    return parent
+
+
+def kruskal(neighbors, rng, cells=None):
+    """Randomized Kruskal's algorithm with an array-based union-find."""
+    n = len(neighbors)
+    sources = np.repeat(np.arange(n, dtype=np.int32), neighbors.shape[1])
+    others = neighbors.ravel()
+    # Keep each undirected edge once, then visit the edges in random order.
+    keep = others > sources
+    order = rng.permutation(int(keep.sum()))
+    edges_a = sources[keep][order].tolist()
+    edges_b = others[keep][order].tolist()
+
+    root = list(range(n))
+    tree_size = (n if cells is None else len(cells)) - 1
+    tree_a, tree_b = [], []
+    for a, b in zip(edges_a, edges_b):
+        u, v = a, b
+        # Find both set representatives with path halving.
+        while root[u] != u:
+            root[u] = root[root[u]]
+            u = root[u]
+        while root[v] != v:
+            root[v] = root[root[v]]
+            v = root[v]
+        if u != v:
+            root[u] = v
+            tree_a.append(a)
+            tree_b.append(b)
+            if len(tree_a) == tree_size:
+                break
+    return _orient(n, tree_a, tree_b, _start(cells, n, rng))
+
+
+def wilson(neighbors, rng, cells=None):
+    """
+    Wilson's algorithm (loop-erased random walks).
+
+    Produces a uniform spanning tree. Loops are erased implicitly by only
+    remembering the last exit taken from each cell during a walk.
+    """
+    n = len(neighbors)
+    adjacency = _adjacency(neighbors)
+    uniform = _uniforms(rng)
+    parent = [NO_PARENT] * n
+    in_tree = [False] * n
+    exit_to = [NO_PARENT] * n
+
+    in_tree[_start(cells, n, rng)] = True
+    for cell in rng.permutation(n if cells is None else cells).tolist():
+        # Random walk from ``cell`` until it hits the tree.
+        current = cell
+        while not in_tree[current]:
+            options = adjacency[current]
+            exit_to[current] = options[int(next(uniform) * len(options))]
+            current = exit_to[current]
+        # Retrace the loop-erased path and add it to the tree.
+        current = cell
+        while not in_tree[current]:
+            in_tree[current] = True
+            parent[current] = exit_to[current]
+            current = exit_to[current]
+    return parent
+
+
+def prim(neighbors, rng, cells=None):
+    """Randomized Prim's algorithm (random edge weights and a binary heap)."""
+    n = len(neighbors)
+    adjacency = _adjacency(neighbors)
+    uniform = _uniforms(rng)
+    parent = [NO_PARENT] * n
+    in_tree = [False] * n
+
+    start = _start(cells, n, rng)
+    in_tree[start] = True
+    frontier = [(next(uniform), nxt, start) for nxt in adjacency[start]]
+    heapq.heapify(frontier)
+    while frontier:
+        _, cell, via = heapq.heappop(frontier)
+        if in_tree[cell]:
+            continue
+        in_tree[cell] = True
+        parent[cell] = via
+        for nxt in adjacency[cell]:
+            if not in_tree[nxt]:
+                heapq.heappush(frontier, (next(uniform), nxt, cell))
+    return parent
+
+
+def hunt_and_kill(neighbors, rng, cells=None):
+    """
+    Hunt-and-kill: random walks, and a row-major hunt for a fresh start when
+    a walk gets stuck. Each hunt skips the fully visited prefix of the grid
+    instead of scanning from the first cell again.
+    """
+    n = len(neighbors)
+    rows = _shuffled_rows(neighbors, rng)
+    parent = [NO_PARENT] * n
+    visited = [False] * n
+    if cells is not None:
+        # Cells outside the mask count as visited so the hunt skips them
+        visited = [True] * n
+        for cell in cells:
+            visited[cell] = False
+    hunt_from = 0
+
+    current = _start(cells, n, rng)
+    visited[current] = True
+    while current != NO_PARENT:
+        # Kill: walk to a random unvisited neighbor while there is one.
+        for nxt in rows[current]:
+            if nxt != NO_PARENT and not visited[nxt]:
+                visited[nxt] = True
+                parent[nxt] = current
+                current = nxt
+                break
+        else:
+            # Hunt: find an unvisited cell next to the visited region.
+            current = NO_PARENT
+            while hunt_from < n and visited[hunt_from]:
+                hunt_from += 1
+            for cell in range(hunt_from, n):
+                if visited[cell]:
+                    continue
+                for nxt in rows[cell]:
+                    if nxt != NO_PARENT and visited[nxt]:
+                        visited[cell] = True
+                        parent[cell] = nxt
+                        current = cell
+                        break
+                if current != NO_PARENT:
+                    break
+    return parent
+
+
+ALGORITHMS = {
+    "backtracker": backtracker,
+    "kruskal": kruskal,
+    "wilson": wilson,
+    "prim": prim,
+    "hunt_and_kill": hunt_and_kill,
+}
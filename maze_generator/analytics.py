@@ -0,0 +1,203 @@
+"""
+Vectorized difficulty analytics for batches of maze grids.
+
+All metrics are computed with NumPy operations over a stacked batch of grids
+``(N, 2H+1, 2W+1)``, so analyzing many candidates costs a handful of array
+passes instead of a Python loop per maze. The solution is found by dead-end
+filling, applied to every maze of the batch at once: cells with at most one
+live neighbor are removed until only the route between the two openings
+remains (exact for perfect mazes, including shape-masked ones).
+"""
+
+import time
+
+import numpy as np
+
+from .algorithms import ALGORITHMS, neighbor_table
+from .constants import WALL
+from .maze import LEVEL_SIZES, Maze
+
+METRICS = (
+    "solution_length",
+    "dead_ends",
+    "junctions",
+    "branching_factor",
+    "tortuosity",
+    "coverage",
+)
+
+
+def _passages(open_):
+    """Returns the N/S/W/E passage flags of every cell, shape ``(N, H, W)`` each."""
+    north = open_[:, 0:-1:2, 1::2]
+    south = open_[:, 2::2, 1::2]
+    west = open_[:, 1::2, 0:-1:2]
+    east = open_[:, 1::2, 2::2]
+    return north, south, west, east
+
+
+def _fill_dead_ends(passages, cells, degree):
+    """
+    Dead-end filling over the flat cells of the whole batch.
+
+    Only the cells removed in the previous round and their neighbors are
+    touched, so the total work is proportional to the number of cells and
+    the number of rounds to the longest dead-end branch.
+
+    Returns:
+        np.ndarray: Boolean ``(N, H, W)`` mask of the cells that survive.
+    """
+    batch, height, width = degree.shape
+    n = height * width
+    table = neighbor_table(height, width)
+    # (N * n, 4) flat neighbor index per direction, -1 where there is no passage
+    offsets = (np.arange(batch) * n)[:, np.newaxis, np.newaxis]
+    open_sides = np.stack(passages, axis=-1).reshape(batch, n, 4)
+    targets = table[np.newaxis] + offsets
+    # Passages leading off the grid or into solid cells are openings, which
+    # count toward the degree but can never be filled
+    alive = cells.ravel().copy()
+    into_cell = (table >= 0) & alive[np.maximum(targets, 0)]
+    neighbors = np.where(open_sides & into_cell, targets, -1).reshape(-1, 4)
+
+    degree = degree.ravel().copy()
+    frontier = np.flatnonzero(alive & (degree <= 1))
+    while frontier.size:
+        alive[frontier] = False
+        touched = neighbors[frontier].ravel()
+        touched = touched[touched >= 0]
+        touched = touched[alive[touched]]
+        np.subtract.at(degree, touched, 1)
+        frontier = np.unique(touched[degree[touched] <= 1])
+    return alive.reshape(batch, height, width)
+
+
+def analyze(grids):
+    """
+    Computes difficulty metrics for a batch of maze grids.
+
+    Args:
+        grids (np.ndarray): ``(N, 2H+1, 2W+1)`` stacked maze grids (or a single grid).
+
+    Returns:
+        dict: One length-N array per name in ``METRICS``:
+            solution_length: Grid steps on the solution, same as ``len(solution_path)``.
+            dead_ends: Cells with a single passage.
+            junctions: Cells with three or more passages.
+            branching_factor: Side branches leaving the solution, per solution cell.
+            tortuosity: Solution steps divided by the Manhattan distance between
+                        the entrance and the exit.
+            coverage: Fraction of cells that lie on the solution.
+    """
+    grids = np.asarray(grids)
+    if grids.ndim == 2:
+        grids = grids[np.newaxis]
+    open_ = grids != WALL
+    north, south, west, east = _passages(open_)
+    cells = open_[:, 1::2, 1::2]
+    degree = (
+        north.astype(np.int8)
+        + south.astype(np.int8)
+        + west.astype(np.int8)
+        + east.astype(np.int8)
+    )
+
+    # Openings count as passages, so the entrance and exit cells survive
+    alive = _fill_dead_ends((north, south, west, east), cells, degree)
+
+    solution_cells = alive.sum(axis=(1, 2))
+    side_branches = np.where(alive, degree - 2, 0).sum(axis=(1, 2))
+
+    # Entrance and exit are the open walls with a cell on one side only
+    inside = np.pad(cells, ((0, 0), (1, 1), (1, 1)))
+    across = open_[:, 0::2, 1::2] & (inside[:, :-1, 1:-1] != inside[:, 1:, 1:-1])
+    along = open_[:, 1::2, 0::2] & (inside[:, 1:-1, :-1] != inside[:, 1:-1, 1:])
+    b1, r1, c1 = np.nonzero(across)
+    b2, r2, c2 = np.nonzero(along)
+    batch = np.r_[b1, b2]
+    order = np.argsort(batch, kind="stable")
+    batch = batch[order]
+    rows = np.r_[r1 * 2, r2 * 2 + 1][order]
+    cols = np.r_[c1 * 2 + 1, c2 * 2][order]
+    distance = np.zeros(len(grids), dtype=np.int64)
+    if len(batch):
+        first = np.r_[0, np.flatnonzero(np.diff(batch)) + 1]
+        last = np.r_[first[1:] - 1, len(batch) - 1]
+        distance[batch[first]] = np.abs(rows[last] - rows[first]) + np.abs(
+            cols[last] - cols[first]
+        )
+
+    # Cells plus the passages between them plus the two openings
+    solution_length = np.where(solution_cells > 0, 2 * solution_cells + 1, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "solution_length": solution_length,
+            "dead_ends": ((degree == 1) & cells).sum(axis=(1, 2)),
+            "junctions": ((degree >= 3) & cells).sum(axis=(1, 2)),
+            "branching_factor": np.where(
+                solution_cells > 0, side_branches / np.maximum(solution_cells, 1), 0.0
+            ),
+            "tortuosity": np.where(
+                distance > 0, (solution_length - 1) / np.maximum(distance, 1), 0.0
+            ),
+            "coverage": solution_cells / cells.sum(axis=(1, 2)),
+        }
+
+
+def difficulty_score(metrics):
+    """
+    Folds the metrics into one difficulty score in [0, 1].
+
+    Half of the score is how much of the maze the solution covers, the other
+    half how many side branches the solver has to rule out along the way.
+    """
+    return 0.5 * metrics["coverage"] + 0.25 * np.minimum(metrics["branching_factor"], 2)
+
+
+def generate_for_difficulty(
+    level,
+    target,
+    time_budget=1.0,
+    batch_size=32,
+    algorithms=None,
+    color_scheme=None,
+    seed=None,
+):
+    """
+    Generates candidate mazes in batches and returns the closest match to a
+    target difficulty found within the time budget.
+
+    Args:
+        level (str): Difficulty level, one of ``LEVEL_SIZES``.
+        target (float): Wanted ``difficulty_score``, between 0 and 1.
+        time_budget (float): Seconds to spend searching; at least one batch is made.
+        batch_size (int): Candidates generated and analyzed together.
+        algorithms (list | None): Generation algorithms to draw candidates from.
+                                  Mixing them widens the range of difficulties.
+        seed (int | np.random.Generator | None): Seeds the candidate seeds.
+
+    Returns:
+        tuple: ``(maze, score)``, the best solved Maze and its score.
+    """
+    if level not in LEVEL_SIZES:
+        raise ValueError(f"Unknown maze level: {level}")
+    size = LEVEL_SIZES[level]
+    algorithms = algorithms or list(ALGORITHMS)
+    rng = np.random.default_rng(seed)
+
+    best, best_score, best_error = None, None, np.inf
+    deadline = time.perf_counter() + time_budget
+    while best is None or time.perf_counter() < deadline:
+        candidates = []
+        for i in range(batch_size):
+            maze = Maze(size, size, color_scheme, seed=rng)
+            maze.generate(algorithms[i % len(algorithms)], verbose=False)
+            candidates.append(maze)
+        scores = difficulty_score(analyze(np.stack([m.grid for m in candidates])))
+        errors = np.abs(scores - target)
+        i = int(np.argmin(errors))
+        if errors[i] < best_error:
+            best, best_score, best_error = candidates[i], float(scores[i]), errors[i]
+
+    best.solve(verbose=False)
+    return best, best_score
@@ -0,0 +1,229 @@
+"""
+Pre-generated maze bank.
+
+A producer fills one file per level with fixed-size records (bit-packed grid,
+endpoints, seed and generation algorithm). Video jobs open the same file
+through ``np.memmap`` and take the next unused record in O(1), so nothing is
+generated inside a job's critical path. The solution is not stored: it is
+found again with BFS when a maze is taken (about 1 ms for an H maze). Mazes
+are generated with the default corner endpoints.
+
+The file is a ring buffer: ``count`` records have been added and ``taken``
+consumed over the bank's lifetime, record ``i`` lives in slot
+``i % capacity``, and a slot is only refilled once it has been consumed.
+"""
+
+import argparse
+import contextlib
+import fcntl
+import os
+import threading
+
+import numpy as np
+
+from .algorithms import ALGORITHMS
+from .constants import PATH
+from .maze import LEVEL_SIZES, Maze
+
+MAGIC = b"MZBANK03"
+# Stored algorithm ids, in ``ALGORITHMS`` order
+ALGORITHM_NAMES = tuple(ALGORITHMS)
+HEADER_SIZE = 64
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("size", "<u4"),
+        ("capacity", "<u4"),
+        ("count", "<u8"),
+        ("taken", "<u8"),
+    ]
+)
+
+
+def record_dtype(size):
+    """Returns the record layout for a ``size`` x ``size`` maze (483 bytes for H)."""
+    grid_side = size * 2 + 1
+    return np.dtype(
+        [
+            ("seed", "<u8"),
+            ("algorithm", "u1"),
+            ("start", "<u4"),
+            ("end", "<u4"),
+            ("grid", "u1", ((grid_side * grid_side + 7) // 8,)),
+        ]
+    )
+
+
+class MazeBank:
+    def __init__(self, directory, level, capacity=10000):
+        """
+        Opens the bank file for a level, creating it if needed.
+
+        Args:
+            directory (str): Directory holding one ``<level>.bank`` file per level.
+            level (str): Difficulty level, one of ``LEVEL_SIZES``.
+            capacity (int): Number of record slots for a new bank file. Ignored
+                            when the file already exists.
+        """
+        if level not in LEVEL_SIZES:
+            raise ValueError(f"Unknown maze level: {level}")
+        self.level = level
+        self.size = LEVEL_SIZES[level]
+        self.grid_side = self.size * 2 + 1
+        self.path = os.path.join(directory, f"{level}.bank")
+        self.dtype = record_dtype(self.size)
+
+        os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self.path):
+            self._create(capacity)
+
+        self._lock = threading.Lock()
+        self._file = open(self.path, "r+b")
+        self.header = np.memmap(self.path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+        if self.header["magic"][0] != MAGIC or self.header["size"][0] != self.size:
+            raise ValueError(f"{self.path} is not a maze bank for level {level}")
+        self.capacity = int(self.header["capacity"][0])
+        self.records = np.memmap(
+            self.path,
+            dtype=self.dtype,
+            mode="r+",
+            offset=HEADER_SIZE,
+            shape=(self.capacity,),
+        )
+
+    def _create(self, capacity):
+        """Writes an empty bank file with ``capacity`` zeroed record slots."""
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["size"] = self.size
+        header["capacity"] = capacity
+        with open(self.path, "wb") as f:
+            f.write(header.tobytes().ljust(HEADER_SIZE, b"\0"))
+            f.truncate(HEADER_SIZE + capacity * self.dtype.itemsize)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Serializes header updates across threads and processes."""
+        with self._lock:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def __len__(self):
+        """Number of records that are filled and not consumed yet."""
+        return int(self.header["count"][0] - self.header["taken"][0])
+
+    def free(self):
+        """Number of slots the producer can fill right now."""
+        return self.capacity - len(self)
+
+    def add(self, maze):
+        """
+        Stores a generated maze in the next free slot.
+
+        Returns:
+            bool: False if the bank is full.
+        """
+        if (maze.height, maze.width) != (self.size, self.size):
+            raise ValueError(f"Maze is not a {self.level} ({self.size}x{self.size}) maze.")
+        if maze.algorithm not in ALGORITHM_NAMES:
+            raise ValueError("Only mazes made by generate() can be banked.")
+        with self._locked():
+            if self.free() <= 0:
+                return False
+            count = int(self.header["count"][0])
+            record = self.records[count % self.capacity]
+            record["seed"] = maze.seed
+            record["algorithm"] = ALGORITHM_NAMES.index(maze.algorithm)
+            record["start"] = maze.start_node[0] * self.grid_side + maze.start_node[1]
+            record["end"] = maze.end_node[0] * self.grid_side + maze.end_node[1]
+            record["grid"] = np.packbits(maze.grid.ravel() == PATH)
+            self.header["count"] = count + 1
+        return True
+
+    def take(self, color_scheme=None, mask_img=None):
+        """
+        Takes the next unused maze out of the bank in O(1) and solves it.
+        The maze records its seed and algorithm, so ``Maze.from_seed``
+        replays it.
+
+        Returns:
+            Maze or None: A solved maze, or None if the bank is empty.
+        """
+        with self._locked():
+            if len(self) <= 0:
+                return None
+            taken = int(self.header["taken"][0])
+            record = self.records[taken % self.capacity].copy()
+            self.header["taken"] = taken + 1
+
+        maze = Maze(self.size, self.size, color_scheme, mask_img, seed=int(record["seed"]))
+        maze.algorithm = ALGORITHM_NAMES[int(record["algorithm"])]
+        maze.endpoints = "corners"
+        cells = self.grid_side * self.grid_side
+        maze.grid[:] = np.unpackbits(record["grid"], count=cells).reshape(
+            self.grid_side, self.grid_side
+        )
+        maze.start_node = divmod(int(record["start"]), self.grid_side)
+        maze.end_node = divmod(int(record["end"]), self.grid_side)
+        maze.solve("bfs", verbose=False)
+        return maze
+
+    def fill(self, count=None, algorithm="backtracker", workers=1):
+        """
+        Generates mazes into the bank until it is full or ``count`` were added.
+
+        Args:
+            workers (int): Worker processes; above 1 mazes are generated in
+                           batches with ``Maze.generate_many``.
+
+        Returns:
+            int: Number of mazes added.
+        """
+        added = 0
+        while (count is None or added < count) and self.free() > 0:
+            wanted = self.free() if count is None else min(self.free(), count - added)
+            if workers > 1:
+                mazes = Maze.generate_many(
+                    self.level, min(wanted, 256 * workers), workers, algorithm
+                )
+            else:
+                maze = Maze(self.size, self.size)
+                maze.generate(algorithm, verbose=False)
+                mazes = [maze]
+            stored = 0
+            while stored < len(mazes) and self.add(mazes[stored]):
+                stored += 1
+            added += stored
+            if stored < len(mazes):
+                break  # Another producer filled the remaining slots
+        self.flush()
+        return added
+
+    def flush(self):
+        """Writes pending changes of the memory map to disk."""
+        self.records.flush()
+        self.header.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fill the on-disk maze bank.")
+    parser.add_argument("--dir", default=os.getenv("MAZE_BANK_DIR", "maze_bank"))
+    parser.add_argument("--levels", nargs="+", default=list(LEVEL_SIZES))
+    parser.add_argument("--capacity", type=int, default=10000)
+    parser.add_argument("--count", type=int, default=None)
+    parser.add_argument("--algorithm", default="backtracker")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    for level in args.levels:
+        bank = MazeBank(args.dir, level, capacity=args.capacity)
+        added = bank.fill(args.count, args.algorithm, args.workers)
+        print(f"Level {level}: added {added}, {len(bank)} of {bank.capacity} available.")
+        bank.close()
@@ -0,0 +1,132 @@
+"""
+Throughput benchmarks for the maze generator.
+
+Run with ``python -m maze_generator.benchmark``.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from .algorithms import ALGORITHMS, neighbor_table
+from .graph import TOPOLOGIES
+from .maze import Maze
+from .solvers import SOLVERS
+
+SIZES = {"B": 12, "M": 20, "H": 30, "200x200": 200}
+SOLVER_SIZES = {"B": 12, "M": 20, "H": 30, "500x500": 500}
+TOPOLOGY_SIZES = {"square": (30, 30), "hex": (30, 30), "theta": (16,), "triangle": (30, 60)}
+
+
+def _best_of(fn, repeat):
+    """Returns the fastest wall-clock time of ``repeat`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_generation(sizes=None, repeat=5):
+    """
+    Measures cells generated per second for every algorithm and size.
+
+    Returns:
+        dict: ``{(algorithm, size_name): cells_per_second}``
+    """
+    sizes = sizes or SIZES
+    rng = np.random.default_rng(0)
+    results = {}
+    for name, size in sizes.items():
+        neighbors = neighbor_table(size, size)
+        for algorithm, generate in ALGORITHMS.items():
+            seconds = _best_of(lambda: generate(neighbors, rng), repeat)
+            results[(algorithm, name)] = size * size / seconds
+    return results
+
+
+def bench_solvers(sizes=None, repeat=3):
+    """
+    Measures the time each solver strategy needs on a backtracker maze.
+
+    Returns:
+        dict: ``{(strategy, size_name): seconds}``
+    """
+    sizes = sizes or SOLVER_SIZES
+    results = {}
+    for name, size in sizes.items():
+        maze = Maze(size, size)
+        maze.generate(verbose=False)
+        for strategy, solve in SOLVERS.items():
+            results[(strategy, name)] = _best_of(
+                lambda: solve(maze.grid, maze.start_node, maze.end_node), repeat
+            )
+    return results
+
+
+def bench_topologies(sizes=None, algorithm="backtracker", repeat=5):
+    """
+    Measures cells generated per second on every topology. "square" on the
+    plain ``Maze`` lattice is included as "maze" for comparison.
+
+    Returns:
+        dict: ``{topology: cells_per_second}``
+    """
+    sizes = sizes or TOPOLOGY_SIZES
+    rng = np.random.default_rng(0)
+    neighbors = neighbor_table(*sizes["square"])
+    results = {
+        "maze": len(neighbors)
+        / _best_of(lambda: ALGORITHMS[algorithm](neighbors, rng), repeat)
+    }
+    for name, size in sizes.items():
+        graph = TOPOLOGIES[name](*size)
+        seconds = _best_of(lambda: graph.spanning_tree(algorithm, rng), repeat)
+        results[name] = len(graph) / seconds
+    return results
+
+
+def bench_generate_many(level="H", n=2000, workers=None):
+    """
+    Measures ``Maze.generate_many`` throughput for several worker counts.
+
+    Returns:
+        dict: ``{workers: mazes_per_second}``
+    """
+    cpus = os.cpu_count() or 1
+    workers = workers or sorted(count for count in {1, 2, 4, 8, cpus} if count <= cpus)
+    results = {}
+    for count in workers:
+        started = time.perf_counter()
+        Maze.generate_many(level, n, workers=count)
+        results[count] = n / (time.perf_counter() - started)
+    return results
+
+
+if __name__ == "__main__":
+    results = bench_generation()
+    print(f"{'algorithm':<15}" + "".join(f"{name:>12}" for name in SIZES))
+    for algorithm in ALGORITHMS:
+        row = "".join(f"{results[(algorithm, name)]:>12,.0f}" for name in SIZES)
+        print(f"{algorithm:<15}{row}")
+
+    print()
+    results = bench_solvers()
+    print(f"{'solver (ms)':<15}" + "".join(f"{name:>12}" for name in SOLVER_SIZES))
+    for strategy in SOLVERS:
+        row = "".join(
+            f"{results[(strategy, name)] * 1000:>12.2f}" for name in SOLVER_SIZES
+        )
+        print(f"{strategy:<15}{row}")
+
+    print()
+    print(f"{'topology':<15}{'cells/s':>12}")
+    for name, rate in bench_topologies().items():
+        print(f"{name:<15}{rate:>12,.0f}")
+
+    print()
+    print(f"{'workers':<15}{'H mazes/s':>12}")
+    for count, rate in bench_generate_many().items():
+        print(f"{count:<15}{rate:>12,.0f}")
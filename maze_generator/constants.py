@@ -0,0 +1,4 @@
+WALL_VALUE = 0  # Internal grid value for a wall element
+PATH_VALUE = 1  # Internal grid value for a path element
+WALL, PATH = WALL_VALUE, PATH_VALUE
+SOLUTION_VALUE = 2  # Placeholder if needed, but we draw solution separately
@@ -0,0 +1,434 @@
+"""
+Topology-agnostic maze core.
+
+A ``MazeGraph`` is any set of cells with walls between them: square,
+hexagonal, circular (theta) or triangular. The cell graph is stored as a CSR
+adjacency (``indptr``/``indices``) built with NumPy, plus the padded neighbor
+table the generation algorithms in ``algorithms`` already run on, so every
+algorithm works on every topology unchanged. Solving walks the spanning tree
+(``tree.tree_path``) and the metrics come from tree degrees, so nothing here
+depends on the ``2r+1`` grid layout of ``Maze``.
+
+Each topology only adds geometry: cell centers and one polyline per wall,
+used for endpoint openings and for drawing. ``GraphMaze`` wraps a graph with
+the same seed / generate / solve / save_image flow as ``Maze``.
+"""
+
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .algorithms import ALGORITHMS, NO_PARENT, neighbor_table, seeded_rng
+from .render import DELAULT_COLOR_SCHEME
+from .tree import farthest_pair, tree_path
+
+
+def _csr(n, sources, targets):
+    """Builds CSR arrays from directed ``sources -> targets`` pairs."""
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return indptr, targets[order].astype(np.int32)
+
+
+def _padded(indptr, indices, width=None):
+    """Expands CSR rows into a ``(n, width)`` table padded with ``NO_PARENT``."""
+    counts = np.diff(indptr)
+    width = width or max(int(counts.max(initial=0)), 1)
+    rows = np.repeat(np.arange(len(counts)), counts)
+    table = np.full((len(counts), width), NO_PARENT, dtype=np.int32)
+    table[rows, np.arange(len(indices)) - indptr[rows]] = indices
+    return table
+
+
+class MazeGraph:
+    def __init__(self, centers, walls, lines):
+        """
+        Builds the adjacency arrays of a topology.
+
+        Args:
+            centers (np.ndarray): ``(n, 2)`` x/y position of every cell center.
+            walls (np.ndarray): ``(m, 2)`` cell pairs separated by a wall. The
+                                second cell is ``NO_PARENT`` for walls on the
+                                outer boundary.
+            lines (np.ndarray): ``(m, P, 2)`` polyline drawn for every wall.
+        """
+        self.centers = np.asarray(centers, dtype=np.float64)
+        self.walls = np.asarray(walls, dtype=np.int32)
+        self.lines = np.asarray(lines, dtype=np.float64)
+        n = len(self.centers)
+
+        interior = self.walls[:, 1] != NO_PARENT
+        a, b = self.walls[interior].T
+        self.indptr, self.indices = _csr(n, np.r_[a, b], np.r_[b, a])
+        self.neighbors = _padded(self.indptr, self.indices)
+        self.boundary = np.unique(self.walls[~interior, 0])
+
+        # Mean distance between adjacent centers, the unit for tortuosity
+        steps = self.centers[a] - self.centers[b]
+        self.spacing = float(np.hypot(*steps.T).mean()) if len(a) else 1.0
+
+        for array in (
+            self.centers, self.walls, self.lines, self.indptr,
+            self.indices, self.neighbors, self.boundary,
+        ):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return len(self.centers)
+
+    def spanning_tree(self, algorithm="backtracker", rng=None):
+        """
+        Generates a maze over the graph.
+
+        Returns:
+            np.ndarray: int32 parent array, ``NO_PARENT`` for the root.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unknown algorithm: {algorithm}. Choose from {', '.join(ALGORITHMS)}."
+            )
+        rng = np.random.default_rng(rng)
+        return np.asarray(ALGORITHMS[algorithm](self.neighbors, rng), dtype=np.int32)
+
+    def tree_adjacency(self, parent):
+        """Padded adjacency table of the spanning tree, for ``tree.distance_field``."""
+        child = np.flatnonzero(parent != NO_PARENT)
+        via = parent[child]
+        indptr, indices = _csr(len(self), np.r_[child, via], np.r_[via, child])
+        return _padded(indptr, indices, self.neighbors.shape[1])
+
+    def endpoints(self, parent):
+        """Returns the two boundary cells with the longest tree path between them."""
+        if len(self.boundary) < 2:
+            return int(self.boundary[0]), int(self.boundary[0])
+        return farthest_pair(self.tree_adjacency(parent), self.boundary)
+
+    def passages(self, parent):
+        """Returns a bool per wall, True where the spanning tree opened it."""
+        a, b = self.walls.T
+        inside = b != NO_PARENT
+        safe_b = np.where(inside, b, 0)
+        return inside & ((parent[a] == safe_b) | (parent[safe_b] == a))
+
+    def opening(self, cell, avoid=None):
+        """Index of the boundary wall to open for an endpoint cell."""
+        candidates = np.flatnonzero((self.walls[:, 0] == cell) & (self.walls[:, 1] == NO_PARENT))
+        candidates = candidates[candidates != avoid]
+        if not len(candidates):
+            raise ValueError(f"Cell {cell} is not on the maze boundary.")
+        return int(candidates[0])
+
+    def midpoint(self, wall):
+        """Middle point of a wall's polyline."""
+        points = self.lines[wall]
+        return (points[(len(points) - 1) // 2] + points[len(points) // 2]) / 2
+
+    def metrics(self, parent, path):
+        """
+        Difficulty metrics of a maze on this graph, named like ``analytics.METRICS``.
+
+        Args:
+            parent (np.ndarray): Spanning tree from ``spanning_tree``.
+            path (list): Solution cells, from ``tree.tree_path``.
+
+        Returns:
+            dict: ``solution_length`` counts cells here, not grid steps.
+        """
+        degree = np.bincount(
+            np.r_[np.flatnonzero(parent != NO_PARENT), parent[parent != NO_PARENT]],
+            minlength=len(self),
+        )
+        path = np.asarray(path)
+        straight = np.hypot(*(self.centers[path[-1]] - self.centers[path[0]])) / self.spacing
+        return {
+            "solution_length": len(path),
+            "dead_ends": int((degree == 1).sum()),
+            "junctions": int((degree >= 3).sum()),
+            "branching_factor": float((degree[path] - 2).clip(0).sum() / len(path)),
+            "tortuosity": float((len(path) - 1) / straight) if straight > 0 else 0.0,
+            "coverage": len(path) / len(self),
+        }
+
+
+def _polygon_graph(centers, neighbors, corners):
+    """
+    Builds a graph of polygon cells. Side ``k`` of a cell runs from corner
+    ``k`` to corner ``k + 1`` and faces ``neighbors[:, k]``.
+    """
+    n, sides = neighbors.shape
+    cell = np.repeat(np.arange(n, dtype=np.int32), sides)
+    other = neighbors.ravel()
+    # Every wall once: boundary sides, and interior sides from the lower cell
+    keep = (other == NO_PARENT) | (cell < other)
+    start = corners.reshape(-1, 2)
+    end = np.roll(corners, -1, axis=1).reshape(-1, 2)
+    lines = np.stack([start[keep], end[keep]], axis=1)
+    return MazeGraph(centers, np.stack([cell[keep], other[keep]], axis=1), lines)
+
+
+@lru_cache(maxsize=16)
+def square(height, width):
+    """Square cells, one unit wide. Same lattice as ``Maze``."""
+    rows, cols = np.divmod(np.arange(height * width), width)
+    x0, y0 = cols.astype(np.float64), rows.astype(np.float64)
+    corners = np.stack(
+        [
+            np.stack([x0, y0], axis=1),
+            np.stack([x0 + 1, y0], axis=1),
+            np.stack([x0 + 1, y0 + 1], axis=1),
+            np.stack([x0, y0 + 1], axis=1),
+        ],
+        axis=1,
+    )
+    # Sides N, E, S, W from the N/S/W/E table
+    neighbors = neighbor_table(height, width)[:, [0, 3, 1, 2]]
+    return _polygon_graph(np.stack([x0 + 0.5, y0 + 0.5], axis=1), neighbors, corners)
+
+
+@lru_cache(maxsize=16)
+def hexagonal(height, width):
+    """
+    Pointy-top hexagons in offset rows (odd rows shifted right by half a cell),
+    one unit between adjacent centers.
+    """
+    rows, cols = np.divmod(np.arange(height * width), width)
+    odd = rows & 1
+    # Sides E, SE, SW, W, NW, NE, as (row offset, column offset for even, for odd rows)
+    offsets = ((0, 1, 1), (1, 0, 1), (1, -1, 0), (0, -1, -1), (-1, -1, 0), (-1, 0, 1))
+    neighbors = np.full((height * width, 6), NO_PARENT, dtype=np.int32)
+    for k, (dr, even_dc, odd_dc) in enumerate(offsets):
+        nr = rows + dr
+        nc = cols + np.where(odd, odd_dc, even_dc)
+        inside = (nr >= 0) & (nr < height) & (nc >= 0) & (nc < width)
+        neighbors[inside, k] = nr[inside] * width + nc[inside]
+
+    radius = 1 / math.sqrt(3)
+    x = cols + 0.5 * odd + 0.5
+    y = rows * 1.5 * radius + radius
+    angles = np.radians(60 * np.arange(6) - 30)
+    corners = np.stack(
+        [x[:, None] + radius * np.cos(angles), y[:, None] + radius * np.sin(angles)], axis=2
+    )
+    return _polygon_graph(np.stack([x, y], axis=1), neighbors, corners)
+
+
+@lru_cache(maxsize=16)
+def triangular(height, width):
+    """
+    Alternating up and down triangles with unit sides; cell ``(r, c)`` points
+    up when ``r + c`` is even.
+    """
+    rows, cols = np.divmod(np.arange(height * width), width)
+    up = (rows + cols) % 2 == 0
+    h = math.sqrt(3) / 2
+    # Sides W, E, then the base (S for up triangles, N for down ones)
+    neighbors = np.full((height * width, 3), NO_PARENT, dtype=np.int32)
+    for k, (dr, dc) in enumerate(((0, -1), (0, 1))):
+        nc = cols + dc
+        inside = (nc >= 0) & (nc < width)
+        neighbors[inside, k] = rows[inside] * width + nc[inside]
+    nr = np.where(up, rows + 1, rows - 1)
+    inside = (nr >= 0) & (nr < height)
+    neighbors[inside, 2] = nr[inside] * width + cols[inside]
+
+    left, apex, right = cols / 2, (cols + 1) / 2, cols / 2 + 1
+    flat_y = np.where(up, rows + 1, rows) * h
+    apex_y = np.where(up, rows, rows + 1) * h
+    # Up: left base, apex, right base. Down: left top, bottom apex, right top.
+    corners = np.stack(
+        [
+            np.stack([left, flat_y], axis=1),
+            np.stack([apex, apex_y], axis=1),
+            np.stack([right, flat_y], axis=1),
+        ],
+        axis=1,
+    )
+    centers = np.stack([apex, (flat_y * 2 + apex_y) / 3], axis=1)
+    return _polygon_graph(centers, neighbors, corners)
+
+
+def _arc(radius, start, stop, points=9):
+    """``(k, points, 2)`` polylines along circle arcs around the origin."""
+    t = np.linspace(0, 1, points)
+    angle = start[:, None] + (stop - start)[:, None] * t
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=2)
+
+
+@lru_cache(maxsize=16)
+def theta(rings):
+    """
+    Circular maze: a center cell and rings of unit thickness around it. Each
+    ring splits its cells in two when they would get wider than they are deep.
+    At least two rings, so the entrance and exit are on the outer ring.
+    """
+    if rings < 2:
+        raise ValueError("A theta maze needs at least 2 rings.")
+    counts = [1]
+    for r in range(1, rings):
+        ratio = max(1, round(2 * math.pi * r / counts[-1]))
+        counts.append(counts[-1] * ratio)
+    first = np.r_[0, np.cumsum(counts)]
+
+    centers, walls, lines = [np.zeros((1, 2))], [], []
+    points = 9
+    for r, m in enumerate(counts):
+        j = np.arange(m)
+        cells = first[r] + j
+        start, stop = 2 * np.pi * j / m, 2 * np.pi * (j + 1) / m
+        if r:
+            middle = (start + stop) / 2
+            centers.append(np.stack([(r + 0.5) * np.cos(middle), (r + 0.5) * np.sin(middle)], 1))
+            # Arc toward the inner ring, and the radial wall toward the previous cell
+            inner = first[r - 1] + j * counts[r - 1] // m
+            walls.append(np.stack([inner, cells], axis=1))
+            lines.append(_arc(r, start, stop, points))
+            walls.append(np.stack([first[r] + (j - 1) % m, cells], axis=1))
+            radial = np.linspace(r, r + 1, points)[None, :, None]
+            lines.append(radial * np.stack([np.cos(start), np.sin(start)], 1)[:, None, :])
+        if r == rings - 1:
+            walls.append(np.stack([cells, np.full(m, NO_PARENT)], axis=1))
+            lines.append(_arc(r + 1, start, stop, points))
+    return MazeGraph(np.concatenate(centers), np.concatenate(walls), np.concatenate(lines))
+
+
+TOPOLOGIES = {
+    "square": square,
+    "hex": hexagonal,
+    "theta": theta,
+    "triangle": triangular,
+}
+
+class GraphMaze:
+    def __init__(self, topology, *size, color_scheme=None, seed=None):
+        """
+        A maze on any topology in ``TOPOLOGIES``.
+
+        Args:
+            topology (str): "square", "hex" or "triangle" (size is height, width)
+                            or "theta" (size is the number of rings).
+            seed (int | np.random.Generator | None): Seed for this maze's RNG,
+                recorded as ``self.seed`` like ``Maze``.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(
+                f"Unknown topology: {topology}. Choose from {', '.join(TOPOLOGIES)}."
+            )
+        if min(size) < 1:
+            raise ValueError("Maze size must be at least 1.")
+        self.topology = topology
+        self.graph = TOPOLOGIES[topology](*size)
+        self.color_scheme = {**DELAULT_COLOR_SCHEME, **(color_scheme or {})}
+        self.seed, self.rng = seeded_rng(seed)
+
+        self.algorithm = None
+        self.parent = None
+        self.start_cell = None
+        self.end_cell = None
+        self.openings = None
+        self.solution_path = None
+
+    def generate(self, algorithm="backtracker", verbose=True):
+        """
+        Generates the maze, with the entrance and exit as far apart as possible.
+
+        Args:
+            algorithm (str): One of the names in ``ALGORITHMS``.
+            verbose (bool): Whether to print a status message.
+        """
+        self.algorithm = algorithm
+        self.parent = self.graph.spanning_tree(algorithm, self.rng)
+        self.start_cell, self.end_cell = self.graph.endpoints(self.parent)
+        start = self.graph.opening(self.start_cell)
+        self.openings = (start, self.graph.opening(self.end_cell, avoid=start))
+        if verbose:
+            print("Maze generated.")
+
+    def solve(self, verbose=True):
+        """
+        Solves the maze by walking the spanning tree.
+
+        Args:
+            verbose (bool): Whether to print a status message.
+
+        Returns:
+            list or None: Cell indices from the entrance cell to the exit cell.
+        """
+        if self.parent is None:
+            print("Error: Maze not generated yet or no start/end points.")
+            return None
+        self.solution_path = tree_path(self.parent, self.start_cell, self.end_cell)
+        if verbose:
+            print(f"Solution found with {len(self.solution_path)} cells.")
+        return self.solution_path
+
+    def metrics(self):
+        """Difficulty metrics, see ``MazeGraph.metrics``."""
+        path = self.solution_path or tree_path(self.parent, self.start_cell, self.end_cell)
+        return self.graph.metrics(self.parent, path)
+
+    def render(self, unit_size=20, wall_thickness=3, show_solution=False, solution_width=3):
+        """
+        Draws the maze.
+
+        Args:
+            unit_size (int): Pixels per unit of the topology's geometry.
+            wall_thickness (int): Wall line width in pixels.
+            show_solution (bool): If True, draws the solution path.
+            solution_width (int): Solution line width in pixels.
+
+        Returns:
+            PIL.Image.Image: RGBA image.
+        """
+        graph = self.graph
+        closed = ~graph.passages(self.parent)
+        closed[list(self.openings)] = False
+
+        low = graph.lines.reshape(-1, 2).min(axis=0)
+        high = graph.lines.reshape(-1, 2).max(axis=0)
+        margin = unit_size + wall_thickness
+
+        def scale(points):
+            return ((points - low) * unit_size + margin).tolist()
+
+        size = np.ceil((high - low) * unit_size + 2 * margin).astype(int)
+        img = Image.new("RGBA", tuple(size.tolist()), color=self.color_scheme["color_bg"])
+        draw = ImageDraw.Draw(img)
+        radius = wall_thickness / 2
+        for line in graph.lines[closed]:
+            points = [tuple(p) for p in scale(line)]
+            draw.line(points, fill=self.color_scheme["color_wall"], width=wall_thickness, joint="curve")
+            for x, y in (points[0], points[-1]):
+                draw.ellipse(
+                    [x - radius, y - radius, x + radius, y + radius],
+                    fill=self.color_scheme["color_wall"],
+                )
+
+        if show_solution and self.solution_path:
+            route = np.concatenate(
+                [
+                    graph.midpoint(self.openings[0])[None],
+                    graph.centers[self.solution_path],
+                    graph.midpoint(self.openings[1])[None],
+                ]
+            )
+            draw.line(
+                [tuple(p) for p in scale(route)],
+                fill=self.color_scheme["color_solution"],
+                width=solution_width,
+                joint="curve",
+            )
+        return img
+
+    def save_image(self, filename, unit_size=20, wall_thickness=3, show_solution=False, solution_width=3):
+        """Renders the maze and saves it to ``filename``, see ``render``."""
+        img = self.render(unit_size, wall_thickness, show_solution, solution_width)
+        output_dir = os.path.dirname(filename)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        img.save(filename)
+        print(f"Image saved to {filename}")
+        return img
@@ -0,0 +1,65 @@
+"""
+Plain maze data, without any rendering state.
+
+``MazeGrid`` only holds NumPy arrays, endpoints and the seed, so it is cheap
+to pass between threads and processes. It pickles through its arrays, which
+support pickle protocol 5 out-of-band buffers, so the grid is not copied
+into the pickle stream::
+
+    buffers = []
+    data = pickle.dumps(maze_grid, protocol=5, buffer_callback=buffers.append)
+    same = pickle.loads(data, buffers=buffers)  # Views of the same memory
+"""
+
+import numpy as np
+
+
+class MazeGrid:
+    __slots__ = ("grid", "start_node", "end_node", "solution", "seed", "mask")
+
+    def __init__(self, grid, start_node=None, end_node=None, solution=None, seed=None, mask=None):
+        """
+        Args:
+            grid (np.ndarray): ``(2H+1, 2W+1)`` uint8 layout, ``PATH`` or ``WALL``.
+            start_node (tuple | None): Grid position of the entrance.
+            end_node (tuple | None): Grid position of the exit.
+            solution (np.ndarray | list | None): ``(k, 2)`` grid positions of the
+                                                 solution path.
+            seed (int | None): Seed the maze was generated from.
+            mask (np.ndarray | None): ``(H, W)`` bool cells inside the shape, for
+                                      shape-masked mazes.
+        """
+        self.grid = grid
+        self.start_node = None if start_node is None else tuple(start_node)
+        self.end_node = None if end_node is None else tuple(end_node)
+        self.solution = (
+            None if solution is None else np.asarray(solution, dtype=np.int32).reshape(-1, 2)
+        )
+        self.seed = seed
+        self.mask = mask
+
+    def __reduce__(self):
+        return (
+            MazeGrid,
+            (self.grid, self.start_node, self.end_node, self.solution, self.seed, self.mask),
+        )
+
+    @property
+    def height(self):
+        """Number of cell rows."""
+        return (self.grid.shape[0] - 1) // 2
+
+    @property
+    def width(self):
+        """Number of cell columns."""
+        return (self.grid.shape[1] - 1) // 2
+
+    @property
+    def solution_path(self):
+        """
+        The solution as a list of ``(row, col)`` tuples, like ``Maze.solution_path``.
+        Builds the list on every access; array code should read ``solution``.
+        """
+        if self.solution is None:
+            return None
+        return [tuple(node) for node in self.solution.tolist()]
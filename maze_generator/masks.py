@@ -0,0 +1,99 @@
+"""
+Shape masks for mazes.
+
+A cell mask is a boolean ``(height, width)`` array of the cells that belong
+to the maze, usually loaded from a PNG silhouette (a heart, a logo, a number).
+Everything generation needs is precomputed once per mask: the neighbor table
+with outside cells left out, the list of inside cells and the boundary cells
+where an entrance or exit can go. Masks loaded from files are cached per
+``(path, height, width)``, so every channel using the same shape pays the
+setup cost once.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+from PIL import Image
+
+from .algorithms import NO_PARENT, neighbor_table
+
+
+class CellMask(NamedTuple):
+    mask: np.ndarray  # (height, width) bool, True for cells inside the shape
+    neighbors: np.ndarray  # (height * width, 4) neighbor table without outside cells
+    cells: np.ndarray  # Flat indices of the inside cells
+    boundary: np.ndarray  # Inside cells with a side facing the outside
+
+
+def _largest_component(mask):
+    """Keeps the largest 4-connected region of the mask, so the maze is connected."""
+    height, width = mask.shape
+    table = neighbor_table(height, width).tolist()
+    inside = mask.ravel().tolist()
+    label = [0] * len(inside)
+    best, best_size, current = 0, 0, 0
+    for seed in range(len(inside)):
+        if not inside[seed] or label[seed]:
+            continue
+        current += 1
+        label[seed] = current
+        stack, size = [seed], 0
+        while stack:
+            cell = stack.pop()
+            size += 1
+            for nxt in table[cell]:
+                if nxt != NO_PARENT and inside[nxt] and not label[nxt]:
+                    label[nxt] = current
+                    stack.append(nxt)
+        if size > best_size:
+            best, best_size = current, size
+    return (np.asarray(label) == best).reshape(mask.shape) & mask
+
+
+def build_cell_mask(mask):
+    """
+    Precomputes the generation tables for a boolean cell mask.
+
+    Args:
+        mask (np.ndarray): ``(height, width)`` bool array, True for cells in the maze.
+
+    Returns:
+        CellMask: Read-only arrays for the largest connected region of the mask.
+    """
+    mask = _largest_component(np.asarray(mask, dtype=bool))
+    if not mask.any():
+        raise ValueError("Cell mask does not contain any cells.")
+    height, width = mask.shape
+    flat = mask.ravel()
+    table = neighbor_table(height, width)
+
+    neighbors = np.where(flat[table] & (table != NO_PARENT), table, NO_PARENT)
+    neighbors[~flat] = NO_PARENT
+    neighbors = neighbors.astype(np.int32)
+    cells = np.flatnonzero(flat)
+    # A side faces the outside when it leaves the lattice or reaches an outside cell
+    outward = (neighbors[cells] == NO_PARENT).any(axis=1)
+    boundary = cells[outward]
+
+    for array in (mask, neighbors, cells, boundary):
+        array.setflags(write=False)
+    return CellMask(mask, neighbors, cells, boundary)
+
+
+@lru_cache(maxsize=64)
+def load_cell_mask(path, height, width, threshold=128):
+    """
+    Loads a PNG silhouette as a cell mask, cached per ``(path, height, width)``.
+
+    Images with transparency use opaque pixels as the shape; others use dark
+    pixels. The image is scaled to one pixel per cell with area averaging.
+
+    Returns:
+        CellMask
+    """
+    with Image.open(path) as img:
+        transparent = "A" in img.getbands() or "transparency" in img.info
+        channel = img.convert("RGBA").getchannel("A") if transparent else img.convert("L")
+        values = np.asarray(channel.resize((width, height), Image.Resampling.BOX))
+    return build_cell_mask(values >= threshold if transparent else values < threshold)
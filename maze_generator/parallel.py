@@ -0,0 +1,141 @@
+"""
+Multi-process bulk maze generation.
+
+Worker processes generate and solve mazes and write the grids and solution
+paths straight into ``multiprocessing.shared_memory`` arrays, so nothing but
+a few shared-memory names and seeds crosses the process boundary.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .maze import LEVEL_SIZES, Maze
+
+
+def _attach(name, shape, dtype):
+    """
+    Maps an existing shared-memory block as a NumPy array. The parent owns and
+    unlinks the block, so workers attach without registering it with their
+    resource tracker.
+    """
+    shm = shared_memory.SharedMemory(name=name, track=False)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _generate_chunk(size, n, names, seeds, lo, hi, algorithm):
+    """Worker: generates mazes ``lo`` to ``hi`` into the shared arrays."""
+    grid_side = size * 2 + 1
+    max_path = 2 * size * size + 1
+    grid_shm, grids = _attach(names[0], (n, grid_side, grid_side), np.uint8)
+    path_shm, paths = _attach(names[1], (n, max_path), np.int32)
+    len_shm, lengths = _attach(names[2], (n,), np.int32)
+    try:
+        for i, seed in zip(range(lo, hi), seeds):
+            maze = Maze(size, size, seed=seed)
+            maze.generate(algorithm, verbose=False)
+            path = maze.solve(verbose=False)
+            grids[i] = maze.grid
+            lengths[i] = len(path)
+            paths[i, : len(path)] = [r * grid_side + c for r, c in path]
+    finally:
+        del grids, paths, lengths
+        grid_shm.close()
+        path_shm.close()
+        len_shm.close()
+    return hi - lo
+
+
+def generate_arrays(size, n, workers=None, algorithm="backtracker", seed=None):
+    """
+    Generates and solves ``n`` mazes of ``size`` x ``size`` cells in parallel.
+
+    Args:
+        size (int): Cells per side.
+        n (int): Number of mazes.
+        workers (int | None): Worker processes, defaults to the CPU count.
+        algorithm (str): Generation algorithm, see ``ALGORITHMS``.
+        seed (int | None): Seeds the per-maze seeds, for reproducible batches.
+
+    Returns:
+        tuple: ``(grids, paths, lengths, seeds)``: ``(n, 2*size+1, 2*size+1)``
+               uint8 grids, ``(n, max_path)`` int32 solution paths as flat grid
+               indices, the ``(n,)`` path lengths and the ``(n,)`` maze seeds.
+    """
+    if sys.version_info < (3, 13):
+        # Workers attach with SharedMemory(track=False), new in Python 3.13
+        raise RuntimeError("Parallel maze generation needs Python 3.13 or later.")
+    workers = workers or os.cpu_count() or 1
+    grid_side = size * 2 + 1
+    max_path = 2 * size * size + 1
+    seeds = np.random.default_rng(seed).integers(2**63, size=n, dtype=np.uint64)
+
+    specs = (
+        ((n, grid_side, grid_side), np.uint8),
+        ((n, max_path), np.int32),
+        ((n,), np.int32),
+    )
+    blocks = [
+        shared_memory.SharedMemory(
+            create=True, size=max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        )
+        for shape, dtype in specs
+    ]
+    try:
+        names = [block.name for block in blocks]
+        # A few chunks per worker keeps the load balanced without much overhead
+        bounds = np.linspace(0, n, min(n, workers * 4) + 1, dtype=int)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _generate_chunk,
+                    size,
+                    n,
+                    names,
+                    seeds[lo:hi].tolist(),
+                    lo,
+                    hi,
+                    algorithm,
+                )
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+                if hi > lo
+            ]
+            for future in futures:
+                future.result()
+        grids, paths, lengths = (
+            np.ndarray(shape, dtype=dtype, buffer=block.buf).copy()
+            for (shape, dtype), block in zip(specs, blocks)
+        )
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return grids, paths, lengths, seeds
+
+
+def generate_many(level, n, workers=None, algorithm="backtracker", seed=None, color_scheme=None):
+    """
+    Generates and solves ``n`` mazes of a level in parallel.
+
+    Returns:
+        list: Solved ``Maze`` objects, each carrying its own seed.
+    """
+    if level not in LEVEL_SIZES:
+        raise ValueError(f"Unknown maze level: {level}")
+    size = LEVEL_SIZES[level]
+    grid_side = size * 2 + 1
+    grids, paths, lengths, seeds = generate_arrays(size, n, workers, algorithm, seed)
+
+    mazes = []
+    for grid, path, length, maze_seed in zip(grids, paths, lengths, seeds.tolist()):
+        maze = Maze(size, size, color_scheme, seed=maze_seed)
+        maze.algorithm = algorithm
+        maze.grid = grid
+        maze.solution_path = [divmod(node, grid_side) for node in path[:length].tolist()]
+        maze.start_node = maze.solution_path[0]
+        maze.end_node = maze.solution_path[-1]
+        mazes.append(maze)
+    return mazes
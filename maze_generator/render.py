@@ -0,0 +1,703 @@
+"""
+Maze rendering, kept apart from the maze data.
+
+A ``MazeRenderer`` owns the colors and the optional overlay image and draws
+any ``MazeGrid`` it is given, so a maze generated in one process can be drawn
+in another and no color state is shared between jobs.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from .constants import WALL_VALUE
+
+# Labels of the rasterized layers, in drawing order. Label images are
+# colored through a palette indexed by these.
+BACKGROUND_LABEL = 0
+WALL_LABEL = 1
+SOLUTION_LABEL = 2
+START_LABEL = 3
+END_LABEL = 4
+
+# Output size of the video frames, and wall and solution widths as fractions
+# of the spacing between grid elements, so the look does not depend on size
+TARGET_SIZE = (1080, 1080)
+WALL_RATIO = 0.6
+SOLUTION_RATIO = 0.4
+
+DELAULT_COLOR_SCHEME = {
+    "color_bg": (255, 255, 255),  # White background (represents path areas)
+    "color_wall": (0, 0, 0),  # Black for wall lines
+    "color_solution": (255, 0, 0),  # Red for solution path lines
+    "color_start_dot": (0, 200, 0),  # Green for start marker area
+    "color_end_dot": (0, 0, 200),  # Blue for end marker area
+}
+
+
+def _box(x, y, radius):
+    """Bounding box of a circle, for ``ImageDraw.ellipse``."""
+    return [x - radius, y - radius, x + radius, y + radius]
+
+
+@lru_cache(maxsize=64)
+def _kernel(shape, unit_size, width):
+    """
+    Rasterizes one shape with PIL around the center of a grid element, cut into
+    the pixel blocks of that element and its neighbors.
+
+    Element centers are whole pixels, so a shape covers the same pixels
+    wherever it is drawn and can be stamped instead of drawn every time.
+
+    Args:
+        shape (tuple): ``("disk",)`` of diameter ``width``, ``("bar", dr, dc)``
+                       a rectangle of thickness ``width`` to the neighbor at
+                       ``(dr, dc)``, or ``("line", dr, dc)`` a line of that width.
+
+    Returns:
+        tuple: ``(by, bx, piece)`` for every non-empty ``unit_size`` square piece,
+               ``(by, bx)`` being the block offset from the element.
+    """
+    c = unit_size + int(width) + 1
+    canvas = Image.new("1", (2 * c + 1, 2 * c + 1))
+    draw = ImageDraw.Draw(canvas)
+    radius = width / 2
+    if shape[0] == "disk":
+        draw.ellipse(_box(c, c, radius), fill=1)
+    else:
+        _, dr, dc = shape
+        x, y = c + dc * unit_size, c + dr * unit_size
+        if shape[0] == "bar":
+            # Spans center to center, ``width`` thick across the direction
+            draw.rectangle(
+                [c - radius * dr, c - radius * dc, x + radius * dr, y + radius * dc], fill=1
+            )
+        else:
+            draw.line([(c, c), (x, y)], fill=1, width=width)
+    kernel = np.asarray(canvas, dtype=bool)
+
+    # Kernel pixel c lands on the element center, unit_size // 2 into its block
+    offset = c - unit_size // 2
+    reach = -(-offset // unit_size)
+    size = (2 * reach + 1) * unit_size
+    padded = np.zeros((size, size), dtype=bool)
+    start = reach * unit_size - offset
+    n = min(len(kernel), size - start)
+    padded[start : start + n, start : start + n] = kernel[:n, :n]
+    pieces = []
+    for by in range(-reach, reach + 1):
+        for bx in range(-reach, reach + 1):
+            y, x = (by + reach) * unit_size, (bx + reach) * unit_size
+            piece = padded[y : y + unit_size, x : x + unit_size]
+            if piece.any():
+                piece.setflags(write=False)
+                pieces.append((by, bx, piece))
+    return tuple(pieces)
+
+
+def _rasterize(stamps, unit_size, out):
+    """
+    Draws many copies of a few shapes into one label image, without a draw
+    call per copy.
+
+    The image is worked on as one ``unit_size`` square block per grid element.
+    Each kernel piece is written, with a single masked assignment, into every
+    block it reaches from a stamped element.
+
+    Args:
+        stamps (list): ``(where, pieces, label)`` triples: a bool ``(rows, cols)``
+                       mask of the elements to stamp, the shape from ``_kernel``
+                       and the label it paints. Higher labels paint over lower ones.
+        unit_size (int): Pixels per grid element.
+        out (np.ndarray): uint8 ``(rows * unit_size, cols * unit_size)`` view the
+                          labels are written to, 0 where nothing was stamped.
+    """
+    rows, cols = stamps[0][0].shape
+    blocks = np.zeros((rows, cols, unit_size, unit_size), dtype=np.uint8)
+    for where, kernel, label in stamps:
+        for by, bx, piece in kernel:
+            # Block (r, c) gets this piece from the element at (r - by, c - bx)
+            source = where[max(-by, 0) : rows - max(by, 0), max(-bx, 0) : cols - max(bx, 0)]
+            target = blocks[max(by, 0) : rows + min(by, 0), max(bx, 0) : cols + min(bx, 0)]
+            target[source] = np.maximum(target[source], piece * np.uint8(label))
+    out[...] = blocks.transpose(0, 2, 1, 3).reshape(out.shape)
+
+
+def _rgba(color):
+    """Normalizes a PIL color (name, hex string, RGB or RGBA sequence) to RGBA."""
+    if isinstance(color, str):
+        return ImageColor.getcolor(color, "RGBA")
+    return (*color, 255)[:4] if len(color) == 3 else tuple(color)
+
+
+class MaskImageCache:
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Process-wide LRU cache of overlay images, decoded, converted to RGBA and
+        resized. Keys include the file's modification time, so an edited file
+        is loaded again. Shared by all renderers and threads.
+
+        Args:
+            max_bytes (int): Memory cap for the cached pixels. Least recently used
+                             images are dropped beyond it; the newest one
+                             is always kept.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path, size):
+        """
+        Returns the image at ``path`` as RGBA resized to ``size``. The image is
+        shared, so callers must copy it before drawing on it.
+        """
+        key = (os.path.abspath(path), os.stat(path).st_mtime_ns, tuple(size))
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return self._images[key]
+            self.misses += 1
+
+        with Image.open(path) as img:
+            img = img.convert("RGBA").resize(size)
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = img
+                self.nbytes += img.width * img.height * 4
+            while self.nbytes > self.max_bytes and len(self._images) > 1:
+                _, old = self._images.popitem(last=False)
+                self.nbytes -= old.width * old.height * 4
+        return img
+
+    def clear(self):
+        """Drops all images and resets the counters."""
+        with self._lock:
+            self._images.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._images)
+
+
+# Overlay images for every MazeRenderer in the process
+mask_images = MaskImageCache()
+
+
+class LabelImageCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Process-wide LRU cache of label images from ``render_labels``, keyed by
+        a hash of the maze data and the drawing sizes. Labels do not depend on
+        colors, so every renderer and thread drawing the same maze shares them.
+
+        Args:
+            max_bytes (int): Memory cap for the cached labels. Least recently used
+                             images are dropped beyond it; the newest one
+                             is always kept.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._labels = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(maze_grid, *sizes):
+        """Identifies a label image: the grid, shape mask and solution, and the sizes."""
+        h = hashlib.blake2b(digest_size=16)
+        for array in (maze_grid.grid, maze_grid.mask, maze_grid.solution):
+            if array is not None:
+                h.update(np.array(array.shape, dtype="<u4").tobytes())
+                h.update(np.ascontiguousarray(array).tobytes())
+            h.update(b"|")
+        return h.digest(), sizes
+
+    def get(self, key):
+        """Returns the cached labels for ``key``, or None. They are read-only."""
+        with self._lock:
+            labels = self._labels.get(key)
+            if labels is None:
+                self.misses += 1
+                return None
+            self._labels.move_to_end(key)
+            self.hits += 1
+            return labels
+
+    def put(self, key, labels):
+        """Caches ``labels`` for ``key`` and makes them read-only."""
+        labels.setflags(write=False)
+        with self._lock:
+            if key not in self._labels:
+                self._labels[key] = labels
+                self.nbytes += labels.nbytes
+            while self.nbytes > self.max_bytes and len(self._labels) > 1:
+                _, old = self._labels.popitem(last=False)
+                self.nbytes -= old.nbytes
+
+    def clear(self):
+        """Drops all label images and resets the counters."""
+        with self._lock:
+            self._labels.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._labels)
+
+
+# Label images for every MazeRenderer in the process
+label_images = LabelImageCache()
+
+
+class MazeRenderer:
+    def __init__(self, color_scheme=None, mask_img=None):
+        """
+        Args:
+            color_scheme (dict | None): Colors keyed like ``DELAULT_COLOR_SCHEME``.
+                                        Missing keys fall back to the defaults.
+            mask_img (str | None): Image the maze is pasted onto. Walls are then
+                                   drawn transparent so the image shows through.
+        """
+        colors = {**DELAULT_COLOR_SCHEME, **(color_scheme or {})}
+        self.mask_img = mask_img
+        if self.mask_img:
+            colors["color_wall"] = (0, 0, 0, 0)  # Transparent background for masked areas
+
+        # Define colors for image saving
+        self.color_bg = colors["color_bg"]
+        self.color_wall = colors["color_wall"]
+        self.color_solution = colors["color_solution"]
+        self.color_start = colors["color_start_dot"]
+        self.color_end = colors["color_end_dot"]
+
+    @staticmethod
+    def _wall_mask(maze_grid):
+        """
+        Returns the grid elements to draw as walls. For shape-masked mazes only
+        walls touching a cell inside the shape are drawn; the rest is background.
+        """
+        is_wall = maze_grid.grid == WALL_VALUE
+        if maze_grid.mask is None:
+            return is_wall
+        grid_height, grid_width = maze_grid.grid.shape
+        inside = np.zeros(maze_grid.grid.shape, dtype=bool)
+        inside[1::2, 1::2] = maze_grid.mask
+        padded = np.pad(inside, 1)
+        near = np.zeros_like(inside)
+        for dr in (0, 1, 2):
+            for dc in (0, 1, 2):
+                near |= padded[dr : dr + grid_height, dc : dc + grid_width]
+        return is_wall & near
+
+    @staticmethod
+    def _checked_sizes(unit_size, wall_thickness, solution_width):
+        """Clamps the pixel sizes to at least 1."""
+        return max(unit_size, 1), max(wall_thickness, 1), max(solution_width, 1)
+
+    @staticmethod
+    def _placement(maze_grid, unit_size, target_size):
+        """
+        Returns ``(left, top, size)``: where the maze goes in the image and the
+        image size. The maze is centered in ``target_size``, never scaled.
+        """
+        grid_height, grid_width = maze_grid.grid.shape
+        img_width, img_height = grid_width * unit_size, grid_height * unit_size
+        if target_size is None:
+            return 0, 0, (img_width, img_height)
+        if img_width > target_size[0] or img_height > target_size[1]:
+            raise ValueError(
+                f"A {img_width}x{img_height} maze does not fit in {target_size[0]}x{target_size[1]}"
+            )
+        left = (target_size[0] - img_width) // 2
+        top = (target_size[1] - img_height) // 2
+        return left, top, tuple(target_size)
+
+    def render_labels(
+        self,
+        maze_grid,
+        unit_size=5,
+        wall_thickness=2,
+        show_solution=False,
+        solution_width=3,
+        target_size=None,
+        show_walls=True,
+    ):
+        """
+        Draws the maze as a label image instead of colors: ``BACKGROUND_LABEL``,
+        ``WALL_LABEL``, ``SOLUTION_LABEL``, ``START_LABEL`` or ``END_LABEL`` per
+        pixel. Labels do not depend on the colors, so one label image can be
+        colored for any number of color schemes with ``colorize``. Label
+        images are cached in ``label_images``, so drawing the same maze again
+        at the same sizes is a lookup.
+
+        Args:
+            maze_grid (MazeGrid): The maze to draw.
+            unit_size (int): Pixels per unit in the detailed grid. Controls overall scaling.
+            wall_thickness (int): Thickness (diameter) of the wall elements in pixels.
+            show_solution (bool): If True, draws the solution path and markers.
+            solution_width (int): Thickness (diameter) of the solution path elements in pixels.
+            target_size (tuple | None): ``(width, height)`` of the image. The maze is
+                                        centered on the background, never scaled.
+                                        None makes the image as large as the maze.
+            show_walls (bool): If False, leaves the walls out (marker outlines
+                               are still drawn), for a solution overlay.
+
+        Returns:
+            np.ndarray: uint8 ``(height, width)`` labels, read-only and shared.
+        """
+        unit_size, wall_thickness, solution_width = self._checked_sizes(
+            unit_size, wall_thickness, solution_width
+        )
+        left, top, size = self._placement(maze_grid, unit_size, target_size)
+        key = label_images.key(
+            maze_grid,
+            unit_size,
+            wall_thickness,
+            show_solution,
+            solution_width,
+            size,
+            show_walls,
+        )
+        labels = label_images.get(key)
+        if labels is not None:
+            return labels
+        stamps = []
+
+        if show_walls:
+            # Every wall element gets the same disk, and the same bars toward its
+            # east and south wall neighbors, so each shape is rasterized once
+            is_wall = self._wall_mask(maze_grid)
+            east = np.zeros_like(is_wall)
+            east[:, :-1] = is_wall[:, :-1] & is_wall[:, 1:]
+            south = np.zeros_like(is_wall)
+            south[:-1] = is_wall[:-1] & is_wall[1:]
+            stamps += [
+                (is_wall, _kernel(("disk",), unit_size, wall_thickness), WALL_LABEL),
+                (east, _kernel(("bar", 0, 1), unit_size, wall_thickness), WALL_LABEL),
+                (south, _kernel(("bar", 1, 0), unit_size, wall_thickness), WALL_LABEL),
+            ]
+
+        # --- Draw Rounded Solution Path ---
+        path = maze_grid.solution if show_solution else None
+        if path is not None and len(path):
+            # Consecutive path points are adjacent grid elements, so the path is a
+            # circle per point plus one of four unit steps between points, with
+            # round joints where it turns
+            steps = np.diff(path, axis=0)
+            line_width = solution_width + 1
+            on_path = np.zeros(maze_grid.grid.shape, dtype=bool)
+            on_path[path[:, 0], path[:, 1]] = True
+            turns = np.zeros_like(on_path)
+            bends = path[1:-1][np.any(steps[1:] != steps[:-1], axis=1)]
+            turns[bends[:, 0], bends[:, 1]] = True
+            stamps.append((on_path, _kernel(("disk",), unit_size, solution_width), SOLUTION_LABEL))
+            stamps.append((turns, _kernel(("disk",), unit_size, line_width), SOLUTION_LABEL))
+            for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                starts = np.zeros_like(on_path)
+                taken = path[:-1][(steps[:, 0] == dr) & (steps[:, 1] == dc)]
+                starts[taken[:, 0], taken[:, 1]] = True
+                stamps.append(
+                    (starts, _kernel(("line", dr, dc), unit_size, line_width), SOLUTION_LABEL)
+                )
+
+        grid_height, grid_width = maze_grid.grid.shape
+        labels = np.zeros((size[1], size[0]), dtype=np.uint8)
+        if stamps:
+            maze_area = labels[
+                top : top + grid_height * unit_size, left : left + grid_width * unit_size
+            ]
+            _rasterize(stamps, unit_size, maze_area)
+
+        if path is not None and len(path):
+            # Draw start/end markers (larger circles), each on a patch around it
+            marker_radius = solution_width / 2 + max(1, wall_thickness / 2)  # Slightly larger circle
+            reach = int(marker_radius) + 2
+            for (r_grid, c_grid), label in ((path[0], START_LABEL), (path[-1], END_LABEL)):
+                x = left + int(c_grid * unit_size + unit_size / 2)
+                y = top + int(r_grid * unit_size + unit_size / 2)
+                x0, y0 = max(x - reach, 0), max(y - reach, 0)
+                x1, y1 = min(x + reach + 1, size[0]), min(y + reach + 1, size[1])
+                patch = Image.fromarray(labels[y0:y1, x0:x1])
+                ImageDraw.Draw(patch).ellipse(
+                    _box(x - x0, y - y0, marker_radius), fill=label, outline=WALL_LABEL
+                )
+                labels[y0:y1, x0:x1] = np.asarray(patch)
+        label_images.put(key, labels)
+        return labels
+
+    def palette(self, transparent_background=False):
+        """
+        RGBA colors of this renderer, indexed by label.
+
+        Args:
+            transparent_background (bool): Makes the background transparent, for
+                                           solution overlays.
+        """
+        background = (0, 0, 0, 0) if transparent_background else _rgba(self.color_bg)
+        return [
+            background,
+            _rgba(self.color_wall),
+            _rgba(self.color_solution),
+            _rgba(self.color_start),
+            _rgba(self.color_end),
+        ]
+
+    def colorize(self, labels, transparent_background=False):
+        """
+        Colors a label image from ``render_labels`` with this renderer's colors.
+
+        The result is a "P" mode image over the same memory as ``labels``, so
+        recoloring costs a palette of five entries, not a render. Convert it to
+        RGBA when the pixels are needed; the overlay image, if any, is not
+        applied here (see ``render``).
+
+        Args:
+            labels (np.ndarray): uint8 labels, C-contiguous.
+            transparent_background (bool): Makes the background transparent.
+
+        Returns:
+            PIL.Image.Image: The "P" mode image with an RGBA palette.
+        """
+        labels = np.ascontiguousarray(labels, dtype=np.uint8)
+        img = Image.frombuffer("P", labels.shape[::-1], labels, "raw", "P", 0, 1)
+        palette = self.palette(transparent_background)
+        img.putpalette([channel for color in palette for channel in color], rawmode="RGBA")
+        return img
+
+    def _apply_mask_img(self, img):
+        """Pastes the maze onto the overlay image, if any. Walls are transparent there."""
+        if not self.mask_img:
+            return img
+        # --- Draw Mask Image (if provided) ---
+        mask = mask_images.get(self.mask_img, img.size).copy()
+        mask.paste(img, (0, 0), img)  # Paste with mask to keep transparency
+        return mask  # Use the masked image as the final output
+
+    def render_solution(
+        self, maze_grid, unit_size=5, wall_thickness=2, solution_width=3, target_size=None
+    ):
+        """
+        Draws the solution layer: the path and the start and end markers on a
+        transparent image, to composite over the maze drawn by ``render``
+        with the same sizes.
+
+        Args:
+            maze_grid (MazeGrid): The solved maze.
+            unit_size (int): Pixels per unit in the detailed grid.
+            wall_thickness (int): Wall thickness in pixels; the markers are sized from it.
+            solution_width (int): Thickness (diameter) of the solution path elements in pixels.
+            target_size (tuple | None): Image size, as for ``render``.
+
+        Returns:
+            PIL.Image.Image: The RGBA overlay, fully transparent if the maze has no solution.
+        """
+        if maze_grid.grid is None:
+            print("Error: Maze grid not generated.")
+            return None
+        labels = self.render_labels(
+            maze_grid,
+            unit_size,
+            wall_thickness,
+            True,
+            solution_width,
+            target_size,
+            show_walls=False,
+        )
+        return self.colorize(labels, transparent_background=True).convert("RGBA")
+
+    def render(
+        self,
+        maze_grid,
+        unit_size=5,
+        wall_thickness=2,
+        show_solution=False,
+        solution_width=3,
+        target_size=None,
+    ):
+        """
+        Draws the maze with thin walls having rounded corners, and a rounded solution path.
+
+        Args:
+            maze_grid (MazeGrid): The maze to draw.
+            unit_size (int): Pixels per unit in the detailed grid. Controls overall scaling.
+            wall_thickness (int): Thickness (diameter) of the wall elements in pixels.
+            show_solution (bool): If True, draws the solution path.
+            solution_width (int): Thickness (diameter) of the solution path elements in pixels.
+            target_size (tuple | None): ``(width, height)`` of the image. The maze is
+                                        centered on the background, never scaled.
+                                        None makes the image as large as the maze.
+
+        Returns:
+            PIL.Image.Image: The RGBA image.
+        """
+        if maze_grid.grid is None:
+            print("Error: Maze grid not generated.")
+            return None
+        labels = self.render_labels(
+            maze_grid, unit_size, wall_thickness, show_solution, solution_width, target_size
+        )
+        return self._apply_mask_img(self.colorize(labels).convert("RGBA"))
+
+    def fit_sizes(
+        self, maze_grid, target_size=TARGET_SIZE, wall_ratio=WALL_RATIO, solution_ratio=SOLUTION_RATIO
+    ):
+        """
+        Pixel sizes to draw a maze at the output size, without resampling.
+
+        The spacing between grid elements is the largest whole number of pixels
+        that fits, and the walls and the solution are sized from it, so the same
+        maze looks the same at any output size.
+
+        Returns:
+            dict: ``unit_size``, ``wall_thickness``, ``solution_width`` and
+                  ``target_size``, the keyword arguments of ``render``.
+        """
+        grid_height, grid_width = maze_grid.grid.shape
+        unit_size = min(target_size[0] // grid_width, target_size[1] // grid_height)
+        if unit_size < 1:
+            raise ValueError(
+                f"A {grid_width}x{grid_height} grid does not fit in {target_size[0]}x{target_size[1]}"
+            )
+        return {
+            "unit_size": unit_size,
+            "wall_thickness": max(1, round(unit_size * wall_ratio)),
+            "solution_width": min(max(1, round(unit_size * solution_ratio)), unit_size),
+            "target_size": tuple(target_size),
+        }
+
+    def layer_labels(
+        self, maze_grid, target_size=TARGET_SIZE, wall_ratio=WALL_RATIO, solution_ratio=SOLUTION_RATIO
+    ):
+        """
+        Label images of the wall layer and of the solution overlay at the output
+        size, for ``colorize`` or ``paint``.
+
+        Returns:
+            tuple: ``(walls, solution)`` uint8 label arrays of ``target_size``.
+        """
+        sizes = self.fit_sizes(maze_grid, target_size, wall_ratio, solution_ratio)
+        walls = self.render_labels(
+            maze_grid, sizes["unit_size"], sizes["wall_thickness"], target_size=sizes["target_size"]
+        )
+        solution = self.render_labels(maze_grid, show_solution=True, show_walls=False, **sizes)
+        return walls, solution
+
+    def layers(
+        self, maze_grid, target_size=TARGET_SIZE, wall_ratio=WALL_RATIO, solution_ratio=SOLUTION_RATIO
+    ):
+        """
+        Draws the wall layer and the solution overlay at the output size. The
+        solved image is ``Image.alpha_composite(walls, solution)``; the video
+        editor pastes the overlay itself instead.
+
+        Returns:
+            tuple: ``(walls, solution)`` RGBA images of ``target_size``.
+        """
+        if maze_grid.grid is None:
+            print("Error: Maze grid not generated.")
+            return None, None
+        walls, solution = self.layer_labels(maze_grid, target_size, wall_ratio, solution_ratio)
+        return (
+            self._apply_mask_img(self.colorize(walls).convert("RGBA")),
+            self.colorize(solution, transparent_background=True).convert("RGBA"),
+        )
+
+    def paint(self, labels, out, transparent_background=False):
+        """
+        Writes the colors of a label image straight into an RGB array, such as
+        the maze area of a video frame buffer, without creating an image.
+
+        Palette entries with zero alpha are skipped, so with
+        ``transparent_background`` only the drawn pixels are written: painting
+        the solution labels over painted walls gives the solved maze. Other
+        alpha values are painted opaque.
+
+        Args:
+            labels (np.ndarray): uint8 ``(height, width)`` labels from ``render_labels``.
+            out (np.ndarray): uint8 ``(height, width, 3)`` array, written in place.
+                              May be a strided view.
+            transparent_background (bool): Leaves background pixels untouched.
+        """
+        if out.shape != (*labels.shape, 3):
+            raise ValueError(f"Cannot paint {labels.shape} labels into an array of shape {out.shape}")
+        palette = np.array(self.palette(transparent_background), dtype=np.uint8)
+        if self.mask_img and not transparent_background:
+            # Transparent walls show the overlay image
+            out[...] = np.asarray(mask_images.get(self.mask_img, labels.shape[::-1]))[..., :3]
+        opaque = palette[:, 3] > 0
+        if opaque.all():
+            np.take(palette[:, :3], labels, axis=0, out=out, mode="clip")
+        else:
+            drawn = opaque[labels]
+            out[drawn] = palette[labels[drawn], :3]
+
+    def fit(
+        self,
+        maze_grid,
+        target_size=TARGET_SIZE,
+        show_solution=False,
+        wall_ratio=WALL_RATIO,
+        solution_ratio=SOLUTION_RATIO,
+    ):
+        """
+        Draws the maze directly at the output size, without resampling.
+        Sizes come from ``fit_sizes``.
+
+        Args:
+            maze_grid (MazeGrid): The maze to draw.
+            target_size (tuple): ``(width, height)`` of the image in pixels.
+            show_solution (bool): If True, draws the solution path.
+            wall_ratio (float): Wall thickness as a fraction of the spacing.
+            solution_ratio (float): Solution width as a fraction of the spacing.
+
+        Returns:
+            PIL.Image.Image: The RGBA image of ``target_size``.
+        """
+        if maze_grid.grid is None:
+            print("Error: Maze grid not generated.")
+            return None
+        sizes = self.fit_sizes(maze_grid, target_size, wall_ratio, solution_ratio)
+        return self.render(maze_grid, show_solution=show_solution, **sizes)
+
+    def save(
+        self,
+        maze_grid,
+        filename,
+        target_size=TARGET_SIZE,
+        show_solution=False,
+        wall_ratio=WALL_RATIO,
+        solution_ratio=SOLUTION_RATIO,
+    ):
+        """
+        Draws the maze at the output size with ``fit`` and saves it.
+
+        Args:
+            filename (str | None): Path to save the image file. None only renders.
+
+        Returns:
+            PIL.Image.Image: The image.
+        """
+        img = self.fit(maze_grid, target_size, show_solution, wall_ratio, solution_ratio)
+        if img is None:
+            return None
+        # --- Save Image ---
+        if filename:
+            output_dir = os.path.dirname(filename)
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+                print(f"Created directory: {output_dir}")
+            try:
+                img.save(filename)
+                print(f"Image saved to {filename}")
+            except Exception as e:
+                print(f"Error saving image to {filename}: {e}")
+        return img
@@ -0,0 +1,155 @@
+"""
+Animated solution reveal.
+
+The solution is traced from the entrance to the exit over the clip. Nothing
+is drawn per frame: the wall layer is painted into a persistent buffer once,
+every pixel of the solution layer gets the moment it is reached along the
+path, and each frame copies only the pixels reached since the previous
+frame. The cost of a frame is the size of its new segment, and the last
+frame is exactly the static solved image.
+"""
+
+import numpy as np
+
+from .render import (
+    END_LABEL,
+    SOLUTION_RATIO,
+    START_LABEL,
+    TARGET_SIZE,
+    WALL_LABEL,
+    WALL_RATIO,
+    MazeRenderer,
+)
+
+
+class SolutionReveal:
+    def __init__(
+        self,
+        maze_grid,
+        renderer=None,
+        target_size=TARGET_SIZE,
+        wall_ratio=WALL_RATIO,
+        solution_ratio=SOLUTION_RATIO,
+    ):
+        """
+        Args:
+            maze_grid (MazeGrid): The solved maze.
+            renderer (MazeRenderer | None): Colors, default colors if None.
+            target_size (tuple): ``(width, height)`` of the frames in pixels.
+            wall_ratio (float): Wall thickness as a fraction of the grid spacing.
+            solution_ratio (float): Solution width as a fraction of the grid spacing.
+        """
+        self.renderer = renderer or MazeRenderer()
+        sizes = self.renderer.fit_sizes(maze_grid, target_size, wall_ratio, solution_ratio)
+        # The same label layers as the static images, so the reveal ends on them
+        self.walls, self.solution = self.renderer.layer_labels(
+            maze_grid, target_size, wall_ratio, solution_ratio
+        )
+        path = maze_grid.solution
+        if path is None:
+            path = np.zeros((0, 2), dtype=np.int32)
+        self.path = path
+        self.length = max(len(path) - 1, 0)
+        self.unit_size = sizes["unit_size"]
+        self.origin = MazeRenderer._placement(maze_grid, self.unit_size, target_size)[:2]
+        self.grid_shape = maze_grid.grid.shape
+
+        # Built on first use, so the layers can be used as still images for free
+        self.pixels = self.times = self.colors = None
+        self.buffer = None
+        self.revealed = None
+
+    def _prepare(self):
+        """Orders the solution pixels by the time they are reached, with their colors."""
+        left, top = self.origin
+        times = self._reveal_times(self.path, self.unit_size, left, top, self.grid_shape)
+        palette = np.array(self.renderer.palette(transparent_background=True), dtype=np.uint8)
+        flat = self.solution.ravel()
+        visible = np.flatnonzero(palette[flat, 3] > 0)
+        rank = np.argsort(times[visible], kind="stable")
+        self.pixels = visible[rank]
+        self.times = times[visible][rank]
+        self.colors = palette[flat[self.pixels], :3]
+        self.buffer = np.empty((*self.walls.shape, 3), dtype=np.uint8)
+
+    def _reveal_times(self, path, unit_size, left, top, grid_shape):
+        """
+        Returns the position along the path, in grid steps, at which each pixel
+        of the solution layer is drawn (0 for pixels that are not part of it).
+        """
+        times = np.zeros(self.solution.size, dtype=np.float32)
+        if not len(path):
+            return times
+        ys, xs = np.nonzero(self.solution)
+        labels = self.solution[ys, xs]
+
+        # Path index of every grid element; elements next to the path take the
+        # earliest neighboring index, for line caps that spill over
+        index = np.full(grid_shape, len(path), dtype=np.int64)
+        index[path[:, 0], path[:, 1]] = np.arange(len(path))
+        padded = np.pad(index, 1, constant_values=len(path))
+        near = index.copy()
+        for dr in (0, 1, 2):
+            for dc in (0, 1, 2):
+                near = np.minimum(near, padded[dr : dr + grid_shape[0], dc : dc + grid_shape[1]])
+        near[near == len(path)] = 0
+        rows = np.clip((ys - top) // unit_size, 0, grid_shape[0] - 1)
+        cols = np.clip((xs - left) // unit_size, 0, grid_shape[1] - 1)
+        i = near[rows, cols]
+
+        # Project each pixel on the steps into and out of its element
+        centers = path * unit_size + unit_size // 2 + np.array([top, left])
+        pixels = np.stack([ys, xs], axis=1)
+        offset = pixels - centers[i]
+        steps = np.diff(path, axis=0)
+        step_out = np.zeros((len(path), 2), dtype=np.int64)
+        step_out[:-1] = steps
+        step_in = np.zeros((len(path), 2), dtype=np.int64)
+        step_in[1:] = steps
+        forward = (offset * step_out[i]).sum(axis=1) / unit_size
+        backward = (offset * step_in[i]).sum(axis=1) / unit_size
+        t = i + np.where(forward > 0, np.minimum(forward, 1), np.clip(backward, -1, 0))
+
+        # Markers (and their outlines) appear whole, at their end of the path
+        start = ((pixels - centers[0]) ** 2).sum(axis=1)
+        end = ((pixels - centers[-1]) ** 2).sum(axis=1)
+        t = np.where(labels == START_LABEL, 0, t)
+        t = np.where(labels == END_LABEL, len(path) - 1, t)
+        t = np.where(labels == WALL_LABEL, np.where(start <= end, 0, len(path) - 1), t)
+        times[ys * self.solution.shape[1] + xs] = np.clip(t, 0, len(path) - 1)
+        return times
+
+    def render(self, progress):
+        """
+        Draws the maze with the solution traced up to ``progress``.
+
+        Args:
+            progress (float): Fraction of the path drawn, 0 to 1.
+
+        Returns:
+            np.ndarray: The ``(height, width, 3)`` frame buffer. It is reused and
+                        changed by the next call, so copy it to keep it.
+        """
+        if self.pixels is None:
+            self._prepare()
+        count = int(np.searchsorted(self.times, progress * self.length, side="right"))
+        if self.revealed is None or count < self.revealed:
+            # Going back in time starts over from the bare walls
+            self.renderer.paint(self.walls, self.buffer)
+            self.revealed = 0
+        new = self.pixels[self.revealed : count]
+        self.buffer.reshape(-1, 3)[new] = self.colors[self.revealed : count]
+        self.revealed = count
+        return self.buffer
+
+    def frame_function(self, duration):
+        """
+        Returns ``f(t)`` tracing the solution over ``duration`` seconds. Frames
+        are RGB arrays, as expected by ``moviepy.VideoClip``.
+        """
+
+        def frame(t):
+            progress = min(max(t / duration, 0.0), 1.0) if duration > 0 else 1.0
+            return self.render(progress)
+
+        return frame
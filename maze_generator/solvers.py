@@ -0,0 +1,161 @@
+"""
+Maze solvers working on flat grid indices.
+
+The grid is padded with a ring of walls so neighbors are plain index offsets
+with no bounds checks. Every solver records a NumPy parent-index array while
+searching and rebuilds the path once at the end, instead of copying the path
+so far for every queued node.
+"""
+
+import heapq
+
+import numpy as np
+
+from .constants import WALL
+
+UNSEEN = -1
+
+
+def _prepare(grid, start, end):
+    """Returns the padded open-cell flags, padded width and flat start/end indices."""
+    padded = np.pad(grid != WALL, 1, constant_values=False)
+    padded_width = padded.shape[1]
+    source = (start[0] + 1) * padded_width + start[1] + 1
+    target = (end[0] + 1) * padded_width + end[1] + 1
+    return padded.ravel().tolist(), padded_width, source, target
+
+
+def _unwind(parent, node):
+    """Follows parent pointers from ``node`` back to its root (inclusive)."""
+    path = [node]
+    while parent[node] != node:
+        node = int(parent[node])
+        path.append(node)
+    return path
+
+
+def _to_coords(path, padded_width):
+    """Converts padded flat indices into ``(row, col)`` tuples of the original grid."""
+    return [(node // padded_width - 1, node % padded_width - 1) for node in path]
+
+
+def bfs(grid, start, end):
+    """
+    Breadth-first search.
+
+    Args:
+        grid (np.ndarray): Maze grid, ``WALL`` for walls and anything else for paths.
+        start (tuple): ``(row, col)`` of the start node.
+        end (tuple): ``(row, col)`` of the end node.
+
+    Returns:
+        list or None: A list of (row, col) tuples from start to end, or None.
+    """
+    is_open, padded_width, source, target = _prepare(grid, start, end)
+    offsets = (-padded_width, padded_width, -1, 1)
+    parent = np.full(len(is_open), UNSEEN, dtype=np.int64)
+    parent[source] = source
+    queue = [source]
+    head = 0
+    while head < len(queue):
+        node = queue[head]
+        head += 1
+        if node == target:
+            path = _unwind(parent, node)
+            path.reverse()
+            return _to_coords(path, padded_width)
+        for offset in offsets:
+            nxt = node + offset
+            if is_open[nxt] and parent[nxt] == UNSEEN:
+                parent[nxt] = node
+                queue.append(nxt)
+    return None
+
+
+def bidirectional(grid, start, end):
+    """
+    Bidirectional breadth-first search: grows one frontier from each end,
+    always expanding the smaller one, and stops as soon as they touch.
+    Arguments and return value are the same as ``bfs``.
+    """
+    is_open, padded_width, source, target = _prepare(grid, start, end)
+    offsets = (-padded_width, padded_width, -1, 1)
+    parents = (
+        np.full(len(is_open), UNSEEN, dtype=np.int64),
+        np.full(len(is_open), UNSEEN, dtype=np.int64),
+    )
+    parents[0][source] = source
+    parents[1][target] = target
+    frontiers = ([source], [target])
+
+    meet = source if source == target else None
+    while meet is None and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own, other = parents[side], parents[1 - side]
+        next_frontier = []
+        for node in frontiers[side]:
+            for offset in offsets:
+                nxt = node + offset
+                if not is_open[nxt] or own[nxt] != UNSEEN:
+                    continue
+                own[nxt] = node
+                if other[nxt] != UNSEEN:
+                    meet = nxt
+                    break
+                next_frontier.append(nxt)
+            if meet is not None:
+                break
+        frontiers = (
+            (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+        )
+
+    if meet is None:
+        return None
+    path = _unwind(parents[0], meet)
+    path.reverse()
+    path += _unwind(parents[1], meet)[1:]
+    return _to_coords(path, padded_width)
+
+
+def astar(grid, start, end):
+    """
+    A* search with the Manhattan distance to the end as heuristic.
+    Arguments and return value are the same as ``bfs``.
+    """
+    is_open, padded_width, source, target = _prepare(grid, start, end)
+    offsets = (-padded_width, padded_width, -1, 1)
+    target_r, target_c = divmod(target, padded_width)
+    parent = np.full(len(is_open), UNSEEN, dtype=np.int64)
+    parent[source] = source
+    cost = np.full(len(is_open), np.iinfo(np.int64).max, dtype=np.int64)
+    cost[source] = 0
+
+    def heuristic(node):
+        r, c = divmod(node, padded_width)
+        return abs(r - target_r) + abs(c - target_c)
+
+    # Ties on f prefer the deeper node (larger g), which keeps A* on long corridors.
+    heap = [(heuristic(source), 0, source)]
+    while heap:
+        _, neg_g, node = heapq.heappop(heap)
+        if node == target:
+            path = _unwind(parent, node)
+            path.reverse()
+            return _to_coords(path, padded_width)
+        g = -neg_g
+        if g > cost[node]:
+            continue
+        for offset in offsets:
+            nxt = node + offset
+            if is_open[nxt] and g + 1 < cost[nxt]:
+                cost[nxt] = g + 1
+                parent[nxt] = node
+                heapq.heappush(heap, (g + 1 + heuristic(nxt), -(g + 1), nxt))
+    return None
+
+
+SOLVERS = {
+    "bfs": bfs,
+    "bidirectional": bidirectional,
+    "astar": astar,
+}
@@ -0,0 +1,96 @@
+"""
+Streaming maze generation with Eller's algorithm.
+
+``eller_rows`` yields the rows of a maze ``grid`` (same layout as
+``Maze.grid``) one at a time, holding only the set membership of the current
+cell row. Memory stays O(width) no matter how tall the maze is, so very tall
+"scrolling" mazes can be rendered or written out as rows are produced.
+"""
+
+import numpy as np
+
+from .constants import PATH, WALL
+
+
+def _find(labels, label):
+    """Union-find lookup with path halving over a list of set labels."""
+    while labels[label] != label:
+        labels[label] = labels[labels[label]]
+        label = labels[label]
+    return label
+
+
+def eller_rows(height, width, rng=None, join_probability=0.5, down_probability=0.5):
+    """
+    Generates a perfect maze row by row with Eller's algorithm.
+
+    Args:
+        height (int): The number of cells high the maze should be.
+        width (int): The number of cells wide the maze should be.
+        rng (np.random.Generator | None): Random source. A fresh one is used if None.
+        join_probability (float): Chance of joining two horizontally adjacent sets.
+        down_probability (float): Chance of an extra vertical passage per cell.
+
+    Yields:
+        np.ndarray: The ``2 * height + 1`` rows of the maze grid, top to bottom,
+                    each a uint8 array of length ``2 * width + 1``. The entrance
+                    is at ``(1, 0)`` and the exit at the bottom-right, exactly
+                    like ``Maze.generate``. Yielded arrays must not be modified.
+    """
+    if height < 1 or width < 1:
+        raise ValueError("Height and width must be at least 1.")
+    rng = rng if rng is not None else np.random.default_rng()
+    grid_width = width * 2 + 1
+
+    # Top border
+    yield np.full(grid_width, WALL, dtype=np.uint8)
+
+    # Set label of every cell in the current row; labels always stay < 2 * width
+    sets = np.arange(width)
+    for r in range(height):
+        last = r == height - 1
+        row = np.full(grid_width, WALL, dtype=np.uint8)
+        row[1::2] = PATH
+
+        # 1. Randomly join adjacent cells that belong to different sets
+        labels = list(range(2 * width))
+        current = sets.tolist()
+        joins = (rng.random(width - 1) < join_probability).tolist()
+        for c in range(width - 1):
+            a = _find(labels, current[c])
+            b = _find(labels, current[c + 1])
+            if a != b and (last or joins[c]):
+                labels[b] = a
+                row[2 * c + 2] = PATH
+        roots = np.asarray(labels)
+        while True:
+            nxt = roots[roots]
+            if np.array_equal(nxt, roots):
+                break
+            roots = nxt
+        _, sets = np.unique(roots[sets], return_inverse=True)
+
+        if r == 0:
+            row[0] = PATH  # Entrance
+        if last:
+            row[-1] = PATH  # Exit
+        yield row
+
+        below = np.full(grid_width, WALL, dtype=np.uint8)
+        if last:
+            yield below  # Bottom border
+            return
+
+        # 2. Carve downward passages, at least one per set
+        down = rng.random(width) < down_probability
+        keys = rng.random(width)
+        order = np.lexsort((keys, sets))
+        group_last = np.r_[sets[order][1:] != sets[order][:-1], True]
+        down[order[group_last]] = True
+        below[1::2][down] = PATH
+        yield below
+
+        # 3. Cells without a passage from above start in fresh sets
+        fresh = np.flatnonzero(~down)
+        sets = sets.copy()
+        sets[fresh] = width + np.arange(len(fresh))
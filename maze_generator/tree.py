@@ -0,0 +1,95 @@
+"""
+Helpers for the spanning tree recorded by ``Maze.generate``.
+
+A generated maze is a tree over its cells, given as a parent array. Paths
+between two cells come from walking both up to their lowest common ancestor,
+and distance fields from level-by-level NumPy sweeps over the tree's
+adjacency table, so no grid search is needed.
+"""
+
+import numpy as np
+
+from .algorithms import NO_PARENT
+
+
+def tree_adjacency(parent, neighbors):
+    """
+    Builds the adjacency table of the tree from its parent array.
+
+    Args:
+        parent (np.ndarray): Parent cell of every cell, ``NO_PARENT`` for the root.
+        neighbors (np.ndarray): ``(n, 4)`` N/S/W/E neighbor table of the lattice.
+
+    Returns:
+        np.ndarray: ``(n, 4)`` int32 table like ``neighbors`` but only keeping
+                    the neighbors joined by a passage.
+    """
+    adjacency = np.full(neighbors.shape, NO_PARENT, dtype=np.int32)
+    child = np.flatnonzero(parent != NO_PARENT)
+    via = parent[child]
+    side = np.argmax(neighbors[child] == via[:, np.newaxis], axis=1)
+    adjacency[child, side] = via
+    # N/S and W/E are adjacent direction indices, so the opposite side is side ^ 1
+    adjacency[via, side ^ 1] = child
+    return adjacency
+
+
+def distance_field(adjacency, source):
+    """
+    Distances (in cells) from ``source`` to every cell, one NumPy sweep per level.
+
+    Returns:
+        np.ndarray: int32 distances, -1 for cells that cannot be reached.
+    """
+    distance = np.full(len(adjacency), -1, dtype=np.int32)
+    distance[source] = 0
+    frontier = np.array([source])
+    level = 0
+    while frontier.size:
+        level += 1
+        reached = adjacency[frontier].ravel()
+        reached = reached[reached != NO_PARENT]
+        reached = reached[distance[reached] < 0]
+        distance[reached] = level
+        frontier = reached
+    return distance
+
+
+def farthest_pair(adjacency, candidates):
+    """
+    Finds the two candidate cells with the longest tree path between them.
+
+    Two distance-field sweeps: the candidate farthest from an arbitrary
+    candidate is one end of the longest path, and the candidate farthest from
+    that is the other (exact on trees).
+
+    Returns:
+        tuple: ``(a, b)`` flat cell indices.
+    """
+    candidates = np.asarray(candidates)
+    a = candidates[np.argmax(distance_field(adjacency, candidates[0])[candidates])]
+    b = candidates[np.argmax(distance_field(adjacency, a)[candidates])]
+    return int(a), int(b)
+
+
+def tree_path(parent, a, b):
+    """
+    Returns the cells on the tree path from ``a`` to ``b`` (inclusive), found by
+    walking both cells up to their lowest common ancestor.
+    """
+    parent = parent.tolist() if isinstance(parent, np.ndarray) else parent
+    up = []
+    depth = {}
+    node = a
+    while node != NO_PARENT:
+        depth[node] = len(up)
+        up.append(node)
+        node = parent[node]
+
+    down = []
+    node = b
+    while node not in depth:
+        down.append(node)
+        node = parent[node]
+    # ``node`` is now the lowest common ancestor
+    return up[: depth[node] + 1] + down[::-1]
@@ -0,0 +1,301 @@
+"""
+Viewport rendering for very large mazes.
+
+A 1000x1000 maze cannot be drawn whole and scaled down to 1080 pixels, so the
+large levels are shown through a fixed-size viewport instead. The maze image
+is split into square tiles that are rendered on first use and kept in an LRU
+cache, and every frame pastes only the tiles it overlaps. The solution is
+drawn per frame from the path points bucketed by tile, so the cost of a
+frame depends on the viewport size, not on the maze size.
+
+The camera speed is capped (``MAX_PAN_SPEED``). An XXL solution is about 250k
+grid steps, far too long to follow closely in a few seconds, so the pan is
+zoomed out (``pan_unit_size``, down to ``MIN_UNIT_SIZE``) and, if that is
+not enough, the camera track is smoothed further. It then trails behind the
+drawn path through the twists and only keeps the overall route in view; on
+XXL it barely moves from the middle of the route.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .grid import MazeGrid
+from .render import MazeRenderer
+
+# Extra grid elements rendered around a tile so walls crossing its edges are
+# complete. Even, so cells stay on odd positions inside the tile's sub-grid.
+HALO = 2
+
+MAX_PAN_SPEED = 1080  # Camera speed cap in pixels per second, a frame width
+MIN_UNIT_SIZE = 4  # Smallest pixels per grid element a pan zooms out to
+PAN_FPS = 60  # Frame rate the camera speed is checked at
+
+
+def _clamp(start, span, total):
+    """Keeps a view of ``span`` pixels inside ``total``, centered if it does not fit."""
+    if total <= span:
+        return (total - span) // 2
+    return min(max(start, 0), total - span)
+
+
+def _track(points, window, count):
+    """
+    Camera centers at ``count`` evenly spaced positions along the path, the
+    mean of ``window`` points around each, like ``Viewport.camera``.
+    """
+    n = len(points)
+    i = np.linspace(0, n - 1, count)
+    lo = np.clip(i - window // 2, 0, n - 1).astype(np.int64)
+    hi = np.clip(i + window // 2 + 1, lo + 1, n).astype(np.int64)
+    sums = np.concatenate([np.zeros((1, 2)), np.cumsum(points, axis=0)])
+    return (sums[hi] - sums[lo]) / (hi - lo)[:, None]
+
+
+def camera_speed(points, duration, window=None):
+    """
+    Fastest camera motion of a pan along ``points`` over ``duration`` seconds.
+
+    Args:
+        points (np.ndarray): ``(k, 2)`` path points, in pixels or grid units.
+        duration (float): Length of the pan in seconds.
+        window (int | None): Camera smoothing window, as for ``Viewport.camera``.
+
+    Returns:
+        float: Peak speed, in units of ``points`` per second.
+    """
+    if len(points) < 2 or duration <= 0:
+        return 0.0
+    window = window or max(1, len(points) // 200)
+    track = _track(np.asarray(points, dtype=np.float64), window, int(duration * PAN_FPS) + 1)
+    return float(np.hypot(*np.diff(track, axis=0).T).max() * PAN_FPS)
+
+
+def pan_unit_size(maze_grid, duration, unit_size, max_speed=MAX_PAN_SPEED):
+    """
+    The largest pixels per grid element, up to ``unit_size``, at which a pan
+    along the solution stays under ``max_speed``, and not below ``MIN_UNIT_SIZE``.
+    """
+    path = maze_grid.solution
+    speed = camera_speed(path, duration) if path is not None else 0.0
+    if speed * unit_size <= max_speed:
+        return unit_size
+    return max(MIN_UNIT_SIZE, min(unit_size, int(max_speed // speed)))
+
+
+class TileCache:
+    def __init__(self, maze_grid, renderer, unit_size, wall_thickness, tile_size=64, maxsize=256):
+        """
+        Args:
+            maze_grid (MazeGrid): The maze to draw.
+            renderer (MazeRenderer): Draws the tiles (without solution).
+            unit_size (int): Pixels per grid element.
+            wall_thickness (int): Wall thickness in pixels.
+            tile_size (int): Grid elements per tile side, even.
+            maxsize (int): Tiles kept in memory.
+        """
+        self.maze_grid = maze_grid
+        self.renderer = renderer
+        self.unit_size = unit_size
+        self.wall_thickness = wall_thickness
+        self.tile_size = tile_size + tile_size % 2
+        self.maxsize = maxsize
+        self._tiles = OrderedDict()
+
+    def tile(self, ty, tx):
+        """Returns the RGBA image of tile ``(ty, tx)``, rendering it on a cache miss."""
+        key = (ty, tx)
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+
+        grid = self.maze_grid.grid
+        size = self.tile_size
+        r0, c0 = ty * size, tx * size
+        r1, c1 = min(r0 + size, grid.shape[0]), min(c0 + size, grid.shape[1])
+        g0, h0 = max(r0 - HALO, 0), max(c0 - HALO, 0)
+        g1, h1 = min(r1 + HALO, grid.shape[0]), min(c1 + HALO, grid.shape[1])
+        mask = self.maze_grid.mask
+        if mask is not None:
+            mask = mask[g0 // 2 : g0 // 2 + (g1 - g0) // 2, h0 // 2 : h0 // 2 + (h1 - h0) // 2]
+        sub = MazeGrid(grid[g0:g1, h0:h1], mask=mask)
+        img = self.renderer.render(sub, self.unit_size, self.wall_thickness)
+        unit = self.unit_size
+        img = img.crop(
+            ((c0 - h0) * unit, (r0 - g0) * unit, (c1 - h0) * unit, (r1 - g0) * unit)
+        )
+
+        self._tiles[key] = img
+        if len(self._tiles) > self.maxsize:
+            self._tiles.popitem(last=False)
+        return img
+
+
+class Viewport:
+    def __init__(
+        self,
+        maze_grid,
+        renderer=None,
+        size=(1080, 1080),
+        unit_size=16,
+        wall_thickness=10,
+        solution_width=6,
+        tile_size=64,
+        cache_size=256,
+    ):
+        """
+        A fixed-size window onto a maze image.
+
+        Args:
+            maze_grid (MazeGrid): The solved maze.
+            renderer (MazeRenderer | None): Colors for the tiles, default colors if None.
+            size (tuple): ``(width, height)`` of the viewport in pixels.
+            unit_size (int): Pixels per grid element.
+            wall_thickness (int): Wall thickness in pixels.
+            solution_width (int): Solution line width in pixels.
+            tile_size (int): Grid elements per tile side.
+            cache_size (int): Tiles kept in memory.
+        """
+        self.maze_grid = maze_grid
+        self.renderer = renderer or MazeRenderer()
+        self.size = size
+        self.unit_size = unit_size
+        self.solution_width = solution_width
+        self.tiles = TileCache(
+            maze_grid, self.renderer, unit_size, wall_thickness, tile_size, cache_size
+        )
+        self.image_size = (
+            maze_grid.grid.shape[1] * unit_size,
+            maze_grid.grid.shape[0] * unit_size,
+        )
+
+        # Solution points in pixels, and their indices bucketed by tile
+        path = maze_grid.solution
+        if path is None:
+            path = np.zeros((0, 2), dtype=np.int32)
+        self.points = path[:, ::-1] * unit_size + unit_size / 2
+        tile_size = self.tiles.tile_size
+        buckets = {}
+        for i, key in enumerate(map(tuple, (path // tile_size).tolist())):
+            buckets.setdefault(key, []).append(i)
+        self._path_tiles = {key: np.array(idx) for key, idx in buckets.items()}
+
+    def camera(self, progress, window=None):
+        """
+        Camera center following the solution.
+
+        Args:
+            progress (float): Position along the solution, 0 at the entrance and
+                              1 at the exit.
+            window (int | None): Path points averaged to smooth the camera motion,
+                                 about 1/200 of the path by default.
+
+        Returns:
+            tuple: ``(x, y)`` pixel center in maze image coordinates.
+        """
+        if not len(self.points):
+            return self.image_size[0] / 2, self.image_size[1] / 2
+        window = window or max(1, len(self.points) // 200)
+        i = progress * (len(self.points) - 1)
+        lo = int(np.clip(i - window // 2, 0, len(self.points) - 1))
+        hi = int(np.clip(i + window // 2 + 1, lo + 1, len(self.points)))
+        x, y = self.points[lo:hi].mean(axis=0)
+        return float(x), float(y)
+
+    def render(self, center, progress=None):
+        """
+        Draws the viewport.
+
+        Args:
+            center (tuple): ``(x, y)`` pixel center in maze image coordinates.
+                            Clamped so the view stays inside the maze.
+            progress (float | None): Draws the solution up to this fraction of
+                                     its length. None draws no solution.
+
+        Returns:
+            PIL.Image.Image: RGB image of the viewport size.
+        """
+        width, height = self.size
+        left = int(round(center[0] - width / 2))
+        top = int(round(center[1] - height / 2))
+        left = _clamp(left, width, self.image_size[0])
+        top = _clamp(top, height, self.image_size[1])
+
+        frame = Image.new("RGB", self.size, color=self.renderer.color_bg[:3])
+        tile_px = self.tiles.tile_size * self.unit_size
+        ty0, ty1 = max(top // tile_px, 0), (top + height - 1) // tile_px
+        tx0, tx1 = max(left // tile_px, 0), (left + width - 1) // tile_px
+        ty1 = min(ty1, (self.image_size[1] - 1) // tile_px)
+        tx1 = min(tx1, (self.image_size[0] - 1) // tile_px)
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                tile = self.tiles.tile(ty, tx)
+                frame.paste(tile, (tx * tile_px - left, ty * tile_px - top), tile)
+
+        if progress is not None and len(self.points):
+            self._draw_solution(frame, (left, top), (ty0, ty1, tx0, tx1), progress)
+        return frame
+
+    def _draw_solution(self, frame, origin, tiles, progress):
+        """Draws the visible part of the solution up to ``progress``."""
+        ty0, ty1, tx0, tx1 = tiles
+        visible = [
+            self._path_tiles[(ty, tx)]
+            for ty in range(ty0, ty1 + 1)
+            for tx in range(tx0, tx1 + 1)
+            if (ty, tx) in self._path_tiles
+        ]
+        if not visible:
+            return
+        head = int(round(progress * (len(self.points) - 1)))
+        idx = np.unique(np.concatenate(visible))
+        # One extra point on each side joins the runs to points off screen
+        idx = np.unique(np.concatenate([idx - 1, idx, idx + 1]).clip(0, head))
+        idx = idx[idx <= head]
+        if not len(idx):
+            return
+
+        draw = ImageDraw.Draw(frame)
+        points = self.points - origin
+        runs = np.split(idx, np.flatnonzero(np.diff(idx) > 1) + 1)
+        for run in runs:
+            line = [tuple(p) for p in points[run].tolist()]
+            if len(line) > 1:
+                draw.line(
+                    line, fill=self.renderer.color_solution, width=self.solution_width, joint="curve"
+                )
+        radius = self.solution_width
+        for i, color in ((0, self.renderer.color_start), (head, self.renderer.color_end)):
+            if i in idx:
+                x, y = points[i]
+                draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=color)
+
+    def frame_function(self, duration, max_speed=MAX_PAN_SPEED):
+        """
+        Returns ``f(t)`` for a camera that pans from the entrance to the exit
+        over ``duration`` seconds, drawing the solution as it goes. Frames are
+        RGB arrays, as expected by ``moviepy.VideoClip``.
+
+        Args:
+            duration (float): Length of the pan in seconds.
+            max_speed (float | None): Camera speed cap in pixels per second. The
+                                      camera track is smoothed until it holds,
+                                      at worst down to a fixed camera on the
+                                      path's centroid; None follows the path
+                                      at any speed.
+        """
+        window = max(1, len(self.points) // 200)
+        if max_speed is not None:
+            # A window of twice the path averages all of it at every position
+            while (
+                window < 2 * len(self.points)
+                and camera_speed(self.points, duration, window) > max_speed
+            ):
+                window *= 2
+
+        def frame(t):
+            progress = min(max(t / duration, 0.0), 1.0) if duration > 0 else 1.0
+            return np.asarray(self.render(self.camera(progress, window), progress))
+
+        return frame
@@ -0,0 +1,118 @@
+"""
+Bit-packed wall-mask representation of a maze.
+
+Each cell stores its N/E/S/W walls in 4 bits and two cells share a byte, so a
+maze needs ``height * ceil(width / 2)`` bytes instead of the
+``(2H+1) x (2W+1)`` bytes of ``Maze.grid``. Wall posts (even, even grid
+positions) are always walls and are not stored. A cell with all four walls
+closed is unpacked as solid (outside a shape mask), which never happens for a
+cell of a connected maze with more than one cell or an opening. Solid cells
+are always stored with all four walls, and a wall between two cells is open
+when either cell's bit says so, so openings into solid cells survive.
+"""
+
+import struct
+
+import numpy as np
+
+from .constants import PATH, WALL
+
+NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
+ALL_WALLS = NORTH | EAST | SOUTH | WEST
+
+MAGIC = b"MZW"
+VERSION = 1
+# magic, version, height, width, start row/col, end row/col, seed
+HEADER = struct.Struct("<3sBHHHHHHQ")
+
+
+def pack_walls(grid):
+    """
+    Packs a maze grid into 4 wall bits per cell.
+
+    Args:
+        grid (np.ndarray): A ``(2H+1, 2W+1)`` maze grid.
+
+    Returns:
+        np.ndarray: ``(H, ceil(W / 2))`` uint8 array; the even column of each
+                    pair is in the low nibble.
+    """
+    closed = grid == WALL
+    nibbles = (
+        closed[0:-1:2, 1::2] * NORTH
+        | closed[1::2, 2::2] * EAST
+        | closed[2::2, 1::2] * SOUTH
+        | closed[1::2, 0:-1:2] * WEST
+    ).astype(np.uint8)
+    nibbles[closed[1::2, 1::2]] = ALL_WALLS
+    height, width = nibbles.shape
+    if nibbles.shape[1] % 2:
+        nibbles = np.pad(nibbles, ((0, 0), (0, 1)))
+    packed = nibbles[:, 0::2] | (nibbles[:, 1::2] << 4)
+    if not np.array_equal(unpack_walls(packed, height, width), grid):
+        raise ValueError("Grid cannot be packed losslessly (open post or walled-in cell).")
+    return packed
+
+
+def unpack_walls(packed, height, width):
+    """
+    Rebuilds the maze grid from ``pack_walls`` output.
+
+    Args:
+        packed (np.ndarray): Packed walls, ``(height, ceil(width / 2))`` uint8.
+        height (int): The number of cells high.
+        width (int): The number of cells wide.
+
+    Returns:
+        np.ndarray: The ``(2 * height + 1, 2 * width + 1)`` uint8 maze grid.
+    """
+    nibbles = np.empty((height, packed.shape[1] * 2), dtype=np.uint8)
+    nibbles[:, 0::2] = packed & 0x0F
+    nibbles[:, 1::2] = packed >> 4
+    nibbles = nibbles[:, :width]
+
+    north = (nibbles & NORTH) != 0
+    south = (nibbles & SOUTH) != 0
+    west = (nibbles & WEST) != 0
+    east = (nibbles & EAST) != 0
+    # A wall between two cells stands only if both cells have it
+    across = np.ones((height + 1, width), dtype=bool)
+    across[:-1] &= north
+    across[1:] &= south
+    along = np.ones((height, width + 1), dtype=bool)
+    along[:, :-1] &= west
+    along[:, 1:] &= east
+
+    grid = np.full((height * 2 + 1, width * 2 + 1), WALL, dtype=np.uint8)
+    grid[1::2, 1::2] = np.where(nibbles == ALL_WALLS, WALL, PATH)
+    grid[0::2, 1::2] = np.where(across, WALL, PATH)
+    grid[1::2, 0::2] = np.where(along, WALL, PATH)
+    return grid
+
+
+def dumps(grid, start_node, end_node, seed=0):
+    """
+    Serializes a maze into a compact binary record (header plus packed walls).
+
+    Returns:
+        bytes: ``24 + H * ceil(W / 2)`` bytes, e.g. 474 bytes for an H maze.
+    """
+    height, width = (grid.shape[0] - 1) // 2, (grid.shape[1] - 1) // 2
+    header = HEADER.pack(
+        MAGIC, VERSION, height, width, *start_node, *end_node, seed or 0
+    )
+    return header + pack_walls(grid).tobytes()
+
+
+def loads(data):
+    """
+    Reverses ``dumps``.
+
+    Returns:
+        tuple: ``(grid, start_node, end_node, seed)``
+    """
+    magic, version, height, width, sr, sc, er, ec, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Data is not a serialized maze.")
+    packed = np.frombuffer(data, dtype=np.uint8, offset=HEADER.size).reshape(height, -1)
+    return unpack_walls(packed, height, width), (sr, sc), (er, ec), seed
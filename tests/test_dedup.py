@@ -0,0 +1,32 @@
+import numpy as np
+
+from maze_generator.constants import PATH, WALL
+from maze_generator.dedup import DedupIndex, symmetries
+from maze_generator.maze import Maze
+
+
+def reopen_corners(grid):
+    """Closes the outer wall and opens it at the standard corner endpoints."""
+    grid = grid.copy()
+    grid[0, :] = grid[-1, :] = grid[:, 0] = grid[:, -1] = WALL
+    grid[1, 0] = grid[-2, -1] = PATH
+    return grid
+
+
+def test_symmetries_of_published_maze_are_seen(tmp_path):
+    maze = Maze(12, 12, seed=7)
+    maze.generate(verbose=False)
+    index = DedupIndex(str(tmp_path / "seen.bin"), capacity=1000)
+    assert index.add(maze.grid)
+
+    for variant in symmetries(maze.grid):
+        assert reopen_corners(variant) in index
+
+
+def test_other_maze_is_new(tmp_path):
+    index = DedupIndex(str(tmp_path / "seen.bin"), capacity=1000)
+    for seed in range(2):
+        maze = Maze(12, 12, seed=seed)
+        maze.generate(verbose=False)
+        assert index.add(maze.grid)
+    assert len(index) == 2
@@ -0,0 +1,18 @@
+import sys
+
+import pytest
+
+from maze_generator.maze import Maze
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 13), reason="SharedMemory(track=False) needs Python 3.13"
+)
+
+
+def test_generate_many_matches_serial_generation():
+    mazes = Maze.generate_many("B", 8, workers=2, seed=5)
+    assert len(mazes) == 8
+    for maze in mazes:
+        replay = Maze.from_seed("B", maze.seed)
+        assert (replay.grid == maze.grid).all()
+        assert replay.solution_path == maze.solution_path
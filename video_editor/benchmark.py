@@ -0,0 +1,96 @@
+"""
+Render time of a video with each VideoEditor backend.
+
+Run with ``python -m video_editor.benchmark``. The video is the usual three
+levels (B, M and H), each followed by its solution clip.
+"""
+
+import os
+import tempfile
+import time
+
+from maze_generator import LEVEL_SIZES, Maze, MazeRenderer
+
+from .editor import VideoEditor, image_size
+
+FONT_SCHEME = {
+    "text_font": ["video_editor/fonts/Anton-Regular.ttf", 60],
+    "cta_font": ["video_editor/fonts/Anton-Regular.ttf", 50],
+    "timer_font": ["video_editor/fonts/BebasNeue-Regular.ttf", 80],
+}
+BACKENDS = ("moviepy", "ffmpeg")
+
+
+def sample_clips(levels=("B", "M", "H"), duration=10, solution_duration=3):
+    """Builds the clip list of a video, a maze clip and a solution clip per level."""
+    renderer = MazeRenderer()
+    clips = []
+    for idx, level in enumerate(levels):
+        size = LEVEL_SIZES[level]
+        maze = Maze(size, size, seed=idx)
+        maze.generate(verbose=False)
+        maze.solve(verbose=False)
+        walls, solution = renderer.layer_labels(maze.to_grid(), image_size)
+
+        def draw_solution(out, walls=walls, solution=solution):
+            renderer.paint(walls, out)
+            renderer.paint(solution, out, transparent_background=True)
+
+        last = idx == len(levels) - 1
+        common = {"image": None, "cta": "Can you find the way out? Comment your time!"}
+        clips.append(
+            {
+                **common,
+                "draw": lambda out, walls=walls: renderer.paint(walls, out),
+                "label": f"Level {idx + 1} of {len(levels)}",
+                "duration": duration,
+                "timer": True,
+                "timer_text": "Thank you for watching!\nTime left:" if last else "Solution in:",
+            }
+        )
+        clips.append(
+            {
+                **common,
+                "draw": draw_solution,
+                "label": f"Solution of level {idx + 1}",
+                "duration": solution_duration,
+                "timer": not last,
+                "timer_text": "" if last else "Next level in:",
+            }
+        )
+    return clips
+
+
+def bench_backends(backends=BACKENDS, repeat=1):
+    """
+    Measures the wall-clock time to render the sample video, from the clip list
+    to the 60fps file, with each backend.
+
+    Returns:
+        dict: ``{backend: seconds}``, without backends that fell back to moviepy.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="video_benchmark_") as directory:
+        for backend in backends:
+            best = float("inf")
+            for _ in range(repeat):
+                output_path = os.path.join(directory, f"{backend}.mp4")
+                started = time.perf_counter()
+                editor = VideoEditor(
+                    sample_clips(),
+                    output_path,
+                    font_scheme=dict(FONT_SCHEME),
+                    backend=backend,
+                    verbose=False,
+                )
+                editor.create_video()
+                best = min(best, time.perf_counter() - started)
+            if editor.backend == backend:
+                results[backend] = best
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'backend':<15}{'seconds':>12}")
+    for backend, seconds in bench_backends().items():
+        print(f"{backend:<15}{seconds:>12.2f}")
@@ -1,8 +1,10 @@
-from moviepy import TextClip, ImageClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips, afx
+from moviepy import TextClip, ImageClip, VideoClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips, afx
 import numpy as np
-from PIL import Image, ImageFont, ImageDraw
-import emoji
-import subprocess
+from PIL import Image, ImageColor, ImageDraw
+
+from .ffmpeg_backend import OUTPUT_FPS, FFmpegTimeline, drawtext_available
+from .text import load_font, text_bbox, wrap_text_by_words
+from .timer import TimerText, glyph_atlas
 
 video_width = 1080
 video_height = 1920
@@ -12,65 +14,76 @@ target_resolution = (video_width, video_height)
 image_size = (image_width, image_height)
 
 
-def is_emoji(char):
-    return char in emoji.EMOJI_DATA
+def hold_frames(clip):
+    """
+    Wraps a clip that only changes on whole seconds, such as a still maze
+    under a countdown, so it is composited once per second. The other frames
+    of the second return the same array.
+    """
+    held = {}
 
+    def frame(t):
+        second = int(t)
+        if second not in held:
+            held.clear()
+            held[second] = clip.get_frame(second)
+        return held[second]
 
-def get_word_width(word, text_font, fontsize):
-    width = 0
-    for char in word:
-        if is_emoji(char):
-            width += fontsize
-        else:
-            bbox = text_font.getbbox(char)
-            width += bbox[2] - bbox[0]
-    return width
+    return VideoClip(frame, duration=clip.duration).with_audio(clip.audio)
 
 
-def wrap_text_by_words(text, text_font, max_width, fontsize):
-    words = text.split(" ")
-    space_width = text_font.getbbox(" ")[2] - text_font.getbbox(" ")[0]
+def paste_frames(clip, frames, position):
+    """
+    Draws an animation over a held clip from ``hold_frames``, in a region no
+    other layer overlaps. Each frame only copies the animated region; the rest
+    of the frame is copied when the held frame changes, once per second.
 
-    lines = []
-    current_line = []
-    current_width = 0
+    Args:
+        clip (VideoClip): The held clip.
+        frames (callable): ``frames(t)`` returns the RGB region for time t.
+        position (tuple): ``(x, y)`` of the region in the frame.
+    """
+    out = None
+    base = None
+    x, y = position
 
-    for word in words:
-        word_width = get_word_width(word, text_font, fontsize)
-        space = space_width if current_line else 0
+    def frame(t):
+        nonlocal out, base
+        held = clip.get_frame(t)
+        if held is not base:
+            if out is None:
+                out = np.empty_like(held)
+            out[...] = held
+            base = held
+        region = frames(t)
+        out[y : y + region.shape[0], x : x + region.shape[1]] = region
+        return out
+
+    return VideoClip(frame, duration=clip.duration).with_audio(clip.audio)
 
-        if current_width + word_width + space <= max_width:
-            current_line.append(word)
-            current_width += word_width + space
-        else:
-            if current_line:
-                lines.append(current_line)
-            if word_width > max_width:
-                # fallback to char-based split for long words
-                split = list(word)
-                for c in split:
-                    if (
-                        not lines
-                        or get_word_width("".join(lines[-1]) + c, text_font, fontsize)
-                        > max_width
-                    ):
-                        lines.append([c])
-                    else:
-                        lines[-1].append(c)
-                current_line = []
-                current_width = 0
-            else:
-                current_line = [word]
-                current_width = word_width
-
-    if current_line:
-        lines.append(current_line)
-    return lines
+
+def blend_into(out, img):
+    """Alpha-composites a PIL image over an RGB array of the same size, in place."""
+    rgba = np.asarray(img.convert("RGBA"))
+    alpha = rgba[..., 3:].astype(np.uint16)
+    if alpha.min() == 255:
+        out[...] = rgba[..., :3]
+    elif alpha.max():
+        out[...] = (rgba[..., :3] * alpha + out * (255 - alpha) + 127) // 255
 
 
 class VideoEditor:
-    def __init__(self, mazes, output_path, color_scheme=None, font_scheme=None):
+    def __init__(
+        self,
+        mazes,
+        output_path,
+        color_scheme=None,
+        font_scheme=None,
+        backend="moviepy",
+        verbose=True,
+    ):
         self.mazes = mazes
+        self.verbose = verbose
         self.output_path = output_path
         self.font_scheme = font_scheme or {
             "text_font": "video_editor/fonts/Benton Modern Text Bold.otf",
@@ -78,16 +91,29 @@ class VideoEditor:
             "timer_font": "video_editor/fonts/BebasNeue-Regular.ttf",
         }
         self.font_scheme["emoji_font"] = "video_editor/fonts/NotoColorEmoji.ttf"
-        self.clips = (
-            self.create_sequence(**color_scheme)
-            if color_scheme
-            else self.create_sequence()
-        )
+        # Still images only need one frame per second, which the encoder repeats
+        # up to 60fps; animated clips are generated at the full 60fps
+        animated = any(maze.get("frames") for maze in mazes)
+        self.fps = OUTPUT_FPS if animated else 1
+        self.color_scheme = color_scheme or {}
+
+        # The ffmpeg backend only handles stills; moviepy is the fallback
+        if backend not in ("moviepy", "ffmpeg"):
+            raise ValueError(f"Unknown video backend: {backend}")
+        if backend == "ffmpeg" and animated:
+            self.log("Animated clips need the moviepy backend, using it instead of ffmpeg.")
+            backend = "moviepy"
+        if backend == "ffmpeg" and not drawtext_available():
+            self.log("ffmpeg has no drawtext filter, using the moviepy backend instead.")
+            backend = "moviepy"
+        self.backend = backend
+        self.clips = self.create_sequence(**self.color_scheme) if backend == "moviepy" else None
 
     def create_sequence(
         self, bg_color=(0, 0, 0), text_color=(255, 255, 255), strap_color=(255, 255, 0)
     ):
         clips = []
+        frame_bytes = 0
         paste_x = (video_width - image_width) // 2
         paste_y = (video_height - image_height) // 2
         paste_coords = (paste_x, paste_y)
@@ -103,25 +129,9 @@ class VideoEditor:
             timer_clip = timer_clip.with_position(
                 ("center", 110 + (310 - timer_clip_height) // 2)
             )
-            background = Image.new("RGB", target_resolution, color=bg_color)
-            top_text = self.make_text(
-                text=maze["label"],
-                color=bg_color,
-                size=(video_width, 110),
-                strap_color=strap_color,
-            )
-            lines = wrap_text_by_words(
-                maze["cta"],
-                ImageFont.truetype(
-                    self.font_scheme["cta_font"][0], self.font_scheme["cta_font"][1]
-                ),
-                video_width,
-                self.font_scheme["cta_font"][1],
-            )
-            lines = "\n".join([" ".join(line).strip() for line in lines])
             cta_image = TextClip(
                 self.font_scheme["cta_font"][0],
-                text=lines,
+                text=self.cta_text(maze["cta"]),
                 font_size=self.font_scheme["cta_font"][1],
                 color=text_color,
                 text_align="center",
@@ -130,81 +140,112 @@ class VideoEditor:
             cta_image = cta_image.with_position(
                 ("center", (1500 + (420 - cta_clip_height) // 2) - 50)
             )
-            background.paste(maze["image"], paste_coords)
-            background.paste(top_text, (0, 0), top_text.convert("RGBA"))
-            img_array = np.array(background)
-            img_clip = ImageClip(img_array, duration=maze["duration"])
+            frame = self.still_frame(maze, bg_color, strap_color)
+            img_clip = ImageClip(frame, duration=maze["duration"])
+            frame_bytes += frame.nbytes
             combined_clip = CompositeVideoClip([img_clip, timer_clip, cta_image])
+            if self.fps > 1:
+                # The timer and call to action change once per second at most
+                combined_clip = hold_frames(combined_clip)
+            if maze.get("frames"):
+                # ``frames(t)`` returns the maze area for time t, e.g. a camera pan
+                combined_clip = paste_frames(combined_clip, maze["frames"], paste_coords)
             clips.append(combined_clip)
 
+        self.log(
+            f"Frame buffers: {len(clips)} clips, {frame_bytes / 2**20:.1f} MiB"
+            f" ({frame_bytes / max(len(clips), 1) / 2**20:.1f} MiB per clip)"
+        )
         return clips
 
+    def log(self, message):
+        """Prints a status message unless the editor was made with ``verbose=False``."""
+        if self.verbose:
+            print(message)
+
+    def cta_text(self, cta):
+        """Wraps the call to action to the video width, one line per row."""
+        lines = wrap_text_by_words(
+            cta,
+            load_font(self.font_scheme["cta_font"][0], self.font_scheme["cta_font"][1]),
+            video_width,
+            self.font_scheme["cta_font"][1],
+        )
+        return "\n".join([" ".join(line).strip() for line in lines])
+
+    def still_frame(self, maze, bg_color, strap_color):
+        """
+        Builds the still part of a clip's frame: background, maze and label strap.
+
+        One preallocated frame per clip; the maze is drawn straight into its maze
+        area, and ImageClip wraps the array without copying.
+
+        Returns:
+            np.ndarray: ``(video_height, video_width, 3)`` uint8 frame.
+        """
+        paste_x = (video_width - image_width) // 2
+        paste_y = (video_height - image_height) // 2
+        top_text = self.make_text(
+            text=maze["label"],
+            color=bg_color,
+            size=(video_width, 110),
+            strap_color=strap_color,
+        )
+        frame = np.empty((video_height, video_width, 3), dtype=np.uint8)
+        frame[...] = ImageColor.getrgb(bg_color) if isinstance(bg_color, str) else bg_color[:3]
+        view = frame[paste_y : paste_y + image_height, paste_x : paste_x + image_width]
+        # Animated clips leave the maze area to a layer drawn on top
+        if maze.get("draw") and not maze.get("frames"):
+            # ``draw(view)`` paints the maze into the frame buffer
+            maze["draw"](view)
+        elif not maze.get("frames"):
+            view[...] = np.asarray(maze["image"].convert("RGB"))
+        blend_into(frame[: top_text.height, : top_text.width], top_text)
+        return frame
+
     def create_video(self, preview=False):
+        if self.backend == "ffmpeg":
+            if preview:
+                raise ValueError("The ffmpeg backend cannot preview, use the moviepy backend.")
+            FFmpegTimeline(self, **self.color_scheme).render(self.output_path)
+            return
         video_clip = concatenate_videoclips(self.clips)
         if preview:
             video_clip.show(2)
             video_clip.show(9)
             video_clip.show(59)
         else:
-            video_clip.write_videofile(self.output_path, fps=1)
-            # Run ffmpeg to increase the frame rate to 60fps
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-i",
-                    self.output_path,
-                    "-r",
-                    "60",
-                    "-c:v",
-                    "libx264",  # Video codec
-                    "-preset",
-                    "veryfast",
-                    "-crf",
-                    "23",
-                    "-c:a",
-                    "copy",
-                    self.output_path.replace(".mp4", "_60fps.mp4"),
-                ],
-                check=True,
+            # Frames are generated at self.fps and, for still videos, duplicated
+            # up to 60fps by the encoder, so the video is encoded once
+            video_clip.write_videofile(
+                self.output_path,
+                fps=self.fps,
+                codec="libx264",
+                preset="veryfast",
+                ffmpeg_params=["-r", str(OUTPUT_FPS), "-crf", "23"],
+                logger="bar" if self.verbose else None,
             )
 
     def generate_timer_clips(
         self, duration, text="", display_timer=True, text_color="white"
     ):
-        font_size = self.font_scheme["timer_font"][1]
-        timer_clips = []
+        font_path, font_size = self.font_scheme["timer_font"][:2]
+        if not isinstance(text_color, str):
+            text_color = tuple(text_color)
+        # Glyphs are rasterized once per process; each second only copies digits
+        timer = TimerText(
+            glyph_atlas(font_path, font_size, text_color), duration, text, display_timer
+        )
+        mask_clip = VideoClip(timer.mask_function, is_mask=True, duration=duration)
+        timer_clip = VideoClip(timer.frame_function, duration=duration).with_mask(mask_clip)
         if not display_timer:
-            timer_clips.append(
-                TextClip(
-                    text=text,
-                    font_size=font_size,
-                    color=text_color,
-                    font=self.font_scheme["timer_font"][0],
-                    text_align="center",
-                ).with_duration(duration)
-            )
-            return concatenate_videoclips(timer_clips)
-        else:
-            audio_clip = (
-                AudioFileClip("video_editor/audios/tick-tock.mp3")
-                .with_duration(20)
-                .with_effects([afx.AudioLoop(duration=duration)])
-            )
-            for i in range(duration, 0, -1):
-                minutes = int(i // 60)
-                seconds = int(i % 60)
-                time_str = f"{minutes:02}:{seconds:02}"
-                time_str = f"{text} {time_str}" if text else time_str
-                timer_text = TextClip(
-                    text=time_str,
-                    font_size=font_size,
-                    color=text_color,
-                    font=self.font_scheme["timer_font"][0],
-                    text_align="center",
-                )
-                timer_text = timer_text.with_duration(1)
-                timer_clips.append(timer_text)
-            return concatenate_videoclips(timer_clips).with_audio(audio_clip)
+            return timer_clip
+        audio_clip = (
+            AudioFileClip("video_editor/audios/tick-tock.mp3")
+            .with_duration(20)
+            .with_effects([afx.AudioLoop(duration=duration)])
+        )
+        return timer_clip.with_audio(audio_clip)
 
     def make_text(
         self,
@@ -216,8 +257,8 @@ class VideoEditor:
         font_size = self.font_scheme["text_font"][1]
         img = Image.new("RGBA", size, strap_color)
         draw = ImageDraw.Draw(img)
-        text_font = ImageFont.truetype(self.font_scheme["text_font"][0], font_size)
-        bbox = draw.textbbox((0, 0), text, font=text_font)
+        text_font = load_font(self.font_scheme["text_font"][0], font_size)
+        bbox = text_bbox(text, text_font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         x = (size[0] - text_width) / 2
@@ -229,7 +270,7 @@ class VideoEditor:
 
     def render_emoji(self, char, target_size):
         # Render emoji at large size
-        emoji_font = ImageFont.truetype(self.font_scheme["emoji_font"], 109)
+        emoji_font = load_font(self.font_scheme["emoji_font"], 109)
         bbox = emoji_font.getbbox(char)
         img = Image.new(
             "RGBA", (int(bbox[2] - bbox[0]), int(bbox[3] - bbox[1])), (0, 0, 0, 0)
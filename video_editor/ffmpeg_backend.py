@@ -0,0 +1,198 @@
+"""
+ffmpeg render backend for VideoEditor.
+
+A video of still clips is only still frames, a countdown timer and a looping
+tick-tock track, so the whole timeline is compiled into one ffmpeg command
+instead of compositing every frame in Python. Each clip's frame (maze, label
+strap, call to action and the fixed timer lines) is drawn once and saved as
+an image input. The countdown is a ``drawtext`` filter with ``%{eif}``
+expressions in the scheme's timer font, the tick-tock track is cut and
+looped with ``atrim``/``aloop``, and the concatenated timeline is encoded
+once, directly at 60fps.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
+
+from PIL import Image, ImageColor, ImageDraw
+
+from .text import load_font
+
+TICK_TOCK = "video_editor/audios/tick-tock.mp3"
+TICK_TOCK_SECONDS = 20  # The timer loops the first 20 seconds of the track
+OUTPUT_FPS = 60
+SAMPLE_RATE = 44100
+
+
+@lru_cache(maxsize=None)
+def drawtext_available(ffmpeg="ffmpeg"):
+    """Whether the ffmpeg binary exists and was built with the drawtext filter."""
+    try:
+        filters = subprocess.run(
+            [ffmpeg, "-hide_banner", "-filters"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return any(line.split()[1:2] == ["drawtext"] for line in filters.splitlines())
+
+
+def _hex(color):
+    """ffmpeg color of a PIL color: a name, hex string or RGB(A) sequence."""
+    rgb = ImageColor.getrgb(color) if isinstance(color, str) else tuple(color)
+    return "0x{:02x}{:02x}{:02x}".format(*rgb[:3])
+
+
+def _countdown(duration):
+    """drawtext expansion counting ``MM:SS`` down from ``duration``, once per second."""
+    left = f"({duration}-trunc(t))"
+    return f"%{{eif:trunc({left}/60):d:2}}:%{{eif:mod({left},60):d:2}}"
+
+
+class FFmpegTimeline:
+    def __init__(
+        self, editor, bg_color=(0, 0, 0), text_color=(255, 255, 255), strap_color=(255, 255, 0)
+    ):
+        """
+        Args:
+            editor (VideoEditor): Holds the clip list and fonts, and draws the frames.
+            bg_color, text_color, strap_color: The video color scheme, as for
+                                               ``VideoEditor.create_sequence``.
+        """
+        self.editor = editor
+        self.bg_color = bg_color
+        self.text_color = text_color
+        self.strap_color = strap_color
+
+    def _draw_lines(self, draw, lines, font, top, width):
+        """Draws lines centered horizontally, one font line height apart."""
+        ascent, descent = font.getmetrics()
+        for i, line in enumerate(lines):
+            x = (width - draw.textlength(line, font=font)) / 2
+            draw.text((x, top + i * (ascent + descent)), line, font=font, fill=self.text_color)
+
+    def _clip_inputs(self, maze, directory, index):
+        """
+        Draws a clip's still frame and writes it, with the countdown text file
+        if it has a timer.
+
+        Returns:
+            tuple: ``(frame_path, drawtext)``, the drawtext options or None.
+        """
+        editor = self.editor
+        frame = editor.still_frame(maze, self.bg_color, self.strap_color)
+        height, width = frame.shape[:2]
+        img = Image.fromarray(frame)
+        draw = ImageDraw.Draw(img)
+
+        # Call to action, placed like the moviepy clips
+        cta_font = load_font(*editor.font_scheme["cta_font"][:2])
+        cta = editor.cta_text(maze["cta"]).split("\n")
+        ascent, descent = cta_font.getmetrics()
+        cta_top = (1500 + (420 - len(cta) * (ascent + descent)) // 2) - 50
+        self._draw_lines(draw, cta, cta_font, cta_top, width)
+
+        # Timer lines: everything but the countdown is part of the still frame
+        timer_path, timer_size = editor.font_scheme["timer_font"][:2]
+        timer_font = load_font(timer_path, timer_size)
+        ascent, descent = timer_font.getmetrics()
+        lines = maze["timer_text"].split("\n") if maze["timer_text"] else []
+        if maze["timer"]:
+            prefix = lines.pop() + " " if lines else ""
+            lines.append(None)
+        top = 110 + (310 - len(lines) * (ascent + descent)) // 2
+        self._draw_lines(draw, [line for line in lines if line is not None], timer_font, top, width)
+
+        frame_path = os.path.join(directory, f"clip{index}.png")
+        img.save(frame_path, compress_level=1)
+        if not maze["timer"]:
+            return frame_path, None
+
+        text_path = os.path.join(directory, f"timer{index}.txt")
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write(prefix.replace("\\", "\\\\").replace("%", "\\%") + _countdown(maze["duration"]))
+        font_path = os.path.join(directory, "timer_font" + os.path.splitext(timer_path)[1])
+        if not os.path.exists(font_path):
+            shutil.copyfile(timer_path, font_path)
+        drawtext = (
+            f"drawtext=fontfile={font_path}:textfile={text_path}:expansion=normal"
+            f":fontsize={timer_size}:fontcolor={_hex(self.text_color)}"
+            f":x=(w-text_w)/2:y={top + (len(lines) - 1) * (ascent + descent)}"
+        )
+        return frame_path, drawtext
+
+    def command(self, output_path, directory):
+        """
+        Builds the ffmpeg command for the whole timeline, writing its still
+        frames and text files into ``directory``.
+
+        Returns:
+            list: The command arguments.
+        """
+        inputs, video, audio, ticks = [], [], [], []
+        for index, maze in enumerate(self.editor.mazes):
+            frame_path, drawtext = self._clip_inputs(maze, directory, index)
+            duration = maze["duration"]
+            # One frame per second is enough for a still; fps duplicates it at the end
+            inputs += ["-framerate", "1", "-loop", "1", "-t", str(duration), "-i", frame_path]
+            chain = f"[{index}:v]setsar=1"
+            if drawtext:
+                chain += "," + drawtext
+            video.append(f"{chain}[v{index}]")
+            if maze["timer"]:
+                ticks.append(index)
+            else:
+                audio.append(
+                    f"anullsrc=r={SAMPLE_RATE}:cl=stereo,atrim=0:{duration}[a{index}]"
+                )
+
+        graph = video + audio
+        if ticks:
+            inputs += ["-i", TICK_TOCK]
+            track = len(self.editor.mazes)
+            graph.append(
+                f"[{track}:a]aresample={SAMPLE_RATE},aformat=channel_layouts=stereo"
+                f",atrim=0:{TICK_TOCK_SECONDS},asplit={len(ticks)}"
+                + "".join(f"[tick{index}]" for index in ticks)
+            )
+            for index in ticks:
+                graph.append(
+                    f"[tick{index}]aloop=loop=-1:size={TICK_TOCK_SECONDS * SAMPLE_RATE}"
+                    f",atrim=0:{self.editor.mazes[index]['duration']},asetpts=N/SR/TB[a{index}]"
+                )
+        pairs = "".join(f"[v{index}][a{index}]" for index in range(len(self.editor.mazes)))
+        graph.append(f"{pairs}concat=n={len(self.editor.mazes)}:v=1:a=1[cv][ca]")
+        graph.append(f"[cv]fps={OUTPUT_FPS},format=yuv420p[out]")
+
+        return [
+            "ffmpeg",
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            *inputs,
+            "-filter_complex",
+            ";".join(graph),
+            "-map",
+            "[out]",
+            "-map",
+            "[ca]",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "veryfast",
+            "-crf",
+            "23",
+            "-c:a",
+            "aac",
+            "-movflags",
+            "+faststart",
+            output_path,
+        ]
+
+    def render(self, output_path):
+        """Encodes the timeline to ``output_path`` with a single ffmpeg run."""
+        with tempfile.TemporaryDirectory(prefix="maze_video_") as directory:
+            subprocess.run(self.command(output_path, directory), check=True)
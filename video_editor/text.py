@@ -0,0 +1,90 @@
+"""
+Fonts and text layout shared by all jobs of a process.
+
+Every clip of every job lays out text in the same few fonts, so fonts are
+loaded once per ``(path, size)``, character advances are measured once per
+font, and wrapped lines and label boxes are memoized. After the first job,
+laying out a call to action or a label is a dictionary lookup.
+"""
+
+from functools import lru_cache
+
+import emoji
+from PIL import ImageFont
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """The process-wide ``FreeTypeFont`` of a font file at a size."""
+    return ImageFont.truetype(path, size)
+
+
+def is_emoji(char):
+    return char in emoji.EMOJI_DATA
+
+
+@lru_cache(maxsize=65536)
+def char_width(char, text_font, fontsize):
+    """Advance of a character; emojis are drawn ``fontsize`` pixels wide."""
+    if is_emoji(char):
+        return fontsize
+    return text_font.getlength(char)
+
+
+def get_word_width(word, text_font, fontsize):
+    return sum(char_width(char, text_font, fontsize) for char in word)
+
+
+@lru_cache(maxsize=1024)
+def wrap_text_by_words(text, text_font, max_width, fontsize):
+    """
+    Splits ``text`` into lines of words that fit ``max_width`` pixels. Words
+    wider than a line are split into characters.
+
+    Returns:
+        tuple: The lines, each a tuple of words.
+    """
+    words = text.split(" ")
+    space_width = char_width(" ", text_font, fontsize)
+
+    lines = []
+    current_line = []
+    current_width = 0
+
+    for word in words:
+        word_width = get_word_width(word, text_font, fontsize)
+        space = space_width if current_line else 0
+
+        if current_width + word_width + space <= max_width:
+            current_line.append(word)
+            current_width += word_width + space
+        else:
+            if current_line:
+                lines.append(current_line)
+            if word_width > max_width:
+                # fallback to char-based split for long words, keeping the
+                # width of the last line instead of measuring it again
+                last_width = get_word_width("".join(lines[-1]), text_font, fontsize) if lines else 0
+                for c in word:
+                    c_width = char_width(c, text_font, fontsize)
+                    if not lines or last_width + c_width > max_width:
+                        lines.append([c])
+                        last_width = c_width
+                    else:
+                        lines[-1].append(c)
+                        last_width += c_width
+                current_line = []
+                current_width = 0
+            else:
+                current_line = [word]
+                current_width = word_width
+
+    if current_line:
+        lines.append(current_line)
+    return tuple(tuple(line) for line in lines)
+
+
+@lru_cache(maxsize=1024)
+def text_bbox(text, text_font):
+    """Bounding box of a single line of text drawn at the origin."""
+    return text_font.getbbox(text)
@@ -0,0 +1,153 @@
+"""
+Countdown timers drawn from a glyph atlas.
+
+A timer shows the same font, size and color for every second of every level,
+so the digits, the colon and the prefix lines are rasterized once into a
+``GlyphAtlas`` that is shared by all jobs of the process. A ``TimerText``
+lays the text out once in a fixed-size buffer; each new second copies the
+changed digit glyphs into their slots, and the frames in between return the
+same buffer.
+"""
+
+import math
+import threading
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from .text import load_font
+
+DIGITS = "0123456789"
+
+
+class GlyphAtlas:
+    def __init__(self, font_path, size, color):
+        """
+        Args:
+            font_path (str): Timer font file.
+            size (int): Font size in pixels.
+            color: Text color, a PIL color name, hex string or RGB(A) sequence.
+        """
+        self.font = load_font(font_path, size)
+        ascent, descent = self.font.getmetrics()
+        self.line_height = ascent + descent
+        self.color = ImageColor.getrgb(color)[:3] if isinstance(color, str) else tuple(color)[:3]
+        self._lock = threading.Lock()
+        self._strings = {}
+
+        # Digits share one slot width, so the countdown does not shift sideways
+        self.digit_width = max(self.width(digit) for digit in DIGITS)
+        self.digits = {digit: self._rasterize(digit, self.digit_width) for digit in DIGITS}
+        self.colon = self.text(":")
+
+    def width(self, text):
+        """Pixels covered by ``text``: its advance, or its ink if that reaches further."""
+        return max(math.ceil(self.font.getlength(text)), self.font.getbbox(text)[2], 0)
+
+    def _rasterize(self, text, width=None):
+        """Coverage of ``text`` as float32 alpha, centered in ``width`` pixels if given."""
+        text_width = self.width(text)
+        width = width or text_width
+        img = Image.new("L", (width, self.line_height), 0)
+        ImageDraw.Draw(img).text(((width - text_width) // 2, 0), text, font=self.font, fill=255)
+        return np.asarray(img, dtype=np.float32) / 255
+
+    def text(self, text):
+        """Returns the alpha of a string, rasterizing it on first use."""
+        with self._lock:
+            alpha = self._strings.get(text)
+            if alpha is None:
+                alpha = self._strings[text] = self._rasterize(text)
+        return alpha
+
+
+@lru_cache(maxsize=32)
+def glyph_atlas(font_path, size, color):
+    """The process-wide atlas of a timer font, size and color."""
+    return GlyphAtlas(font_path, size, color)
+
+
+class TimerText:
+    def __init__(self, atlas, duration, text="", countdown=True):
+        """
+        Centered timer lines, the last of them followed by ``MM:SS`` counting
+        down from ``duration`` when ``countdown`` is set.
+
+        Args:
+            atlas (GlyphAtlas): Glyphs of the timer font.
+            duration (int): Length of the clip in seconds.
+            text (str): Lines shown above or before the countdown.
+            countdown (bool): Whether to show the countdown.
+        """
+        self.atlas = atlas
+        self.duration = duration
+        lines = text.split("\n") if text else []
+        prefix = lines.pop() + " " if countdown and lines else ""
+        if not countdown and not lines:
+            lines = [""]
+
+        minutes = len(f"{duration // 60:02}")
+        slot = atlas.digit_width
+        colon = atlas.colon.shape[1]
+        prefix_width = atlas.width(prefix) if prefix else 0
+        count_width = prefix_width + (minutes + 2) * slot + colon if countdown else 0
+        widths = [atlas.width(line) for line in lines]
+        width = max([count_width, 1, *widths])
+        height = atlas.line_height * (len(lines) + countdown)
+
+        self.mask = np.zeros((height, width), dtype=np.float32)
+        self.frame = np.empty((height, width, 3), dtype=np.uint8)
+        self.frame[...] = atlas.color
+        for row, (line, line_width) in enumerate(zip(lines, widths)):
+            if line:
+                self._blit(atlas.text(line), row * atlas.line_height, (width - line_width) // 2)
+
+        # Column of each digit slot on the countdown line; the rest is drawn once
+        self.slots = []
+        self.shown = None  # Digits currently in the slots
+        if countdown:
+            top = len(lines) * atlas.line_height
+            x = (width - count_width) // 2
+            if prefix:
+                self._blit(atlas.text(prefix), top, x)
+                x += prefix_width
+            for i in range(minutes + 2):
+                if i == minutes:
+                    self._blit(atlas.colon, top, x)
+                    x += colon
+                self.slots.append(x)
+                x += slot
+            self.top = top
+
+    @property
+    def size(self):
+        """``(width, height)`` in pixels."""
+        return self.mask.shape[1], self.mask.shape[0]
+
+    def _blit(self, alpha, top, left):
+        """Copies a glyph's alpha into the mask, clipped to the buffer."""
+        height, width = alpha.shape
+        width = min(width, self.mask.shape[1] - left)
+        self.mask[top : top + height, left : left + width] = alpha[:, :width]
+
+    def update(self, t):
+        """Shows the time left at ``t`` seconds, copying only the digits that change."""
+        if not self.slots:
+            return
+        seconds = max(self.duration - int(t), 1)
+        minutes = len(self.slots) - 2
+        digits = f"{seconds // 60:0{minutes}}{seconds % 60:02}"
+        for i, digit in enumerate(digits):
+            if self.shown is None or self.shown[i] != digit:
+                self._blit(self.atlas.digits[digit], self.top, self.slots[i])
+        self.shown = digits
+
+    def frame_function(self, t):
+        """RGB frame at ``t``: the text color everywhere, the mask carries the text."""
+        return self.frame
+
+    def mask_function(self, t):
+        """Alpha frame at ``t``, as expected by a moviepy mask clip."""
+        self.update(t)
+        return self.mask